@@ -57,6 +57,10 @@ class Prism(PrismComponent):
     :param layoutTimeout: Timeout in seconds for layout loading. If a layout callback
         doesn't respond within this time, an error state is shown. Defaults to ``30``.
     :type layoutTimeout: int
+    :param readWorkspaceDebounceMs: Delay in milliseconds before workspace changes
+        are synced to ``readWorkspace``. The first sync is immediate; later changes
+        are debounced so rapid edits produce one callback. Defaults to ``500``.
+    :type readWorkspaceDebounceMs: int
     :param statusBarPosition: Position of the status bar relative to the workspace.
         Options: ``'top'`` or ``'bottom'``. Defaults to ``'bottom'``.
     :type statusBarPosition: str
@@ -235,6 +239,7 @@ class Prism(PrismComponent):
         newTabOpensDropdown: bool = _UNSET,
         searchBarPlaceholder: str = _UNSET,
         layoutTimeout: int = _UNSET,
+        readWorkspaceDebounceMs: int = _UNSET,
         # Advanced — typically managed by dash_prism.init()
         children: list[Component] | None = _UNSET,
         serverSessionId: str | None = _UNSET,
@@ -667,11 +667,10 @@ def init(prism_id: str, app: "Dash", background: bool = False) -> None:
     if prism_component is not None:
         initial_layout = getattr(prism_component, "initialLayout", None)
         if initial_layout is not None:
-            layout_ids = list(registry.layouts.keys())
-            if initial_layout not in layout_ids:
+            if initial_layout not in registry:
                 raise InitializationError(
                     f"initialLayout '{initial_layout}' not found in registered layouts. "
-                    f"Available layouts: {layout_ids}. "
+                    f"Available layouts: {list(registry)}. "
                     "Register the layout with @dash_prism.register_layout() before calling init()."
                 )
             logger.info(f"Initial layout '{initial_layout}' validated successfully")
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import copy
 import logging
-from typing import Any, Callable, Dict, List, Literal, Optional, Set
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -557,17 +557,40 @@ def find_component_by_id(layout: Any, component_id: str) -> Optional[Any]:
     :type component_id: str
     :returns: The component with matching ID, or ``None`` if not found.
     :rtype: Any | None
+
+    .. note:: If several components share ``component_id``, the last one in
+        depth-first pre-order wins, as with a full :func:`walk_layout` pass.
+        The tree is searched in reverse pre-order without being rebuilt, so
+        the search stops at that component instead of visiting every node.
     """
-    result: Optional[Any] = None
+    # Entries are (node, expanded): a component is pushed again as expanded after
+    # its children, so it is matched only once everything after it has been seen
+    stack: List[Tuple[Any, bool]] = [(layout, False)]
+    visited: Set[int] = set()
+
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            if getattr(node, "id", None) == component_id:
+                return node
+            continue
+        if node is None or isinstance(node, (str, int, float, bool)):
+            continue
+        if isinstance(node, (list, tuple)):
+            stack.extend((child, False) for child in node)
+            continue
+        if isinstance(node, dict) and not hasattr(node, "_type"):
+            stack.extend((child, False) for child in node.values())
+            continue
 
-    def search(component: Any) -> Any:
-        nonlocal result
-        if hasattr(component, "id") and component.id == component_id:
-            result = component
-        return component
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+
+        stack.append((node, True))
+        stack.append((getattr(node, "children", None), False))
 
-    walk_layout(layout, search)
-    return result
+    return None
 
 
 def update_component_props(
@@ -102,6 +102,12 @@ export type PrismProps = {
    */
   layoutTimeout?: number;
 
+  /**
+   * Delay in milliseconds before workspace changes are synced to readWorkspace.
+   * The first sync is immediate; later changes are debounced. Default is 500.
+   */
+  readWorkspaceDebounceMs?: number;
+
   /**
    * Position of the status bar relative to the workspace.
    */
@@ -208,12 +214,14 @@ function PrismInner({
         persistenceType: config.persistenceType,
         maxTabs: config.maxTabs,
         setProps: stableSetProps,
+        readWorkspaceDebounceMs: config.readWorkspaceDebounceMs,
         getRegisteredLayouts: stableGetRegisteredLayouts,
       }),
     [
       config.componentId,
       config.persistenceType,
       config.maxTabs,
+      config.readWorkspaceDebounceMs,
       stableSetProps,
       stableGetRegisteredLayouts,
     ]
@@ -322,6 +330,7 @@ export function Prism({
   statusBarPosition = 'bottom',
   searchBarPlaceholder = 'Search layouts...',
   layoutTimeout = 30,
+  readWorkspaceDebounceMs = 500,
   actions = [],
   persistence = false,
   persistence_type = 'memory',
@@ -376,6 +385,7 @@ export function Prism({
           initialLayout={initialLayout}
           newTabOpensDropdown={newTabOpensDropdown}
           layoutTimeout={layoutTimeout}
+          readWorkspaceDebounceMs={readWorkspaceDebounceMs}
           setProps={setProps}
         >
           <PrismInner actions={actions} updateWorkspace={updateWorkspace}>
@@ -25,6 +25,8 @@ type ConfigContextValue = {
   newTabOpensDropdown: boolean;
   /** Timeout in seconds for layout loading (default: 30) */
   layoutTimeout: number;
+  /** Debounce in milliseconds for readWorkspace syncs (default: 500) */
+  readWorkspaceDebounceMs: number;
   /** Dash setProps callback for syncing state to Dash */
   setProps?: (props: Record<string, unknown>) => void;
 };
@@ -50,6 +52,7 @@ type ConfigProviderProps = {
   initialLayout?: string;
   newTabOpensDropdown?: boolean;
   layoutTimeout?: number;
+  readWorkspaceDebounceMs?: number;
   setProps?: (props: Record<string, unknown>) => void;
 };
 
@@ -68,6 +71,7 @@ export function ConfigProvider({
   initialLayout,
   newTabOpensDropdown = true,
   layoutTimeout = 30,
+  readWorkspaceDebounceMs = 500,
   setProps,
 }: ConfigProviderProps) {
   const value = useMemo(
@@ -85,6 +89,7 @@ export function ConfigProvider({
       initialLayout,
       newTabOpensDropdown,
       layoutTimeout,
+      readWorkspaceDebounceMs,
       setProps,
     }),
     [
@@ -101,6 +106,7 @@ export function ConfigProvider({
       initialLayout,
       newTabOpensDropdown,
       layoutTimeout,
+      readWorkspaceDebounceMs,
       setProps,
     ]
   );
@@ -142,7 +142,14 @@ const UNDO_EXCLUDED_ACTIONS = [
  * ```
  */
 export function createPrismStore(config: StoreConfig) {
-  const { componentId, persistenceType, maxTabs, setProps, getRegisteredLayouts } = config;
+  const {
+    componentId,
+    persistenceType,
+    maxTabs,
+    setProps,
+    readWorkspaceDebounceMs,
+    getRegisteredLayouts,
+  } = config;
 
   // Configure persistence for workspace slice only
   // Important: We persist the workspace reducer BEFORE wrapping with redux-undo
@@ -181,7 +188,7 @@ export function createPrismStore(config: StoreConfig) {
   };
 
   // Create dash sync middleware (returns middleware + cleanup function)
-  const dashSync = createDashSyncMiddleware(setProps);
+  const dashSync = createDashSyncMiddleware(setProps, readWorkspaceDebounceMs);
 
   // Configure store
   const store = configureStore({
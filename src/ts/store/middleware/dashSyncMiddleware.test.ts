@@ -23,7 +23,11 @@ import type { PanelId, TabId } from '@types';
 // Test Utilities
 // =============================================================================
 
-function createTestStore(setProps?: (props: Record<string, unknown>) => void, maxTabs = 16) {
+function createTestStore(
+  setProps?: (props: Record<string, unknown>) => void,
+  maxTabs = 16,
+  debounceMs?: number
+) {
   const thunkExtra: ThunkExtra = { maxTabs, getRegisteredLayouts: () => ({}) };
 
   const undoableWorkspaceReducer = undoable(workspaceReducer, {
@@ -36,7 +40,7 @@ function createTestStore(setProps?: (props: Record<string, unknown>) => void, ma
     ui: uiReducer,
   });
 
-  const dashSync = createDashSyncMiddleware(setProps);
+  const dashSync = createDashSyncMiddleware(setProps, debounceMs);
 
   const store = configureStore({
     reducer: rootReducer,
@@ -133,6 +137,19 @@ describe('dashSyncMiddleware', () => {
       vi.advanceTimersByTime(200);
       expect(setProps).toHaveBeenCalledTimes(2); // Now synced
     });
+
+    it('uses a custom debounce delay', async () => {
+      const setProps = vi.fn();
+      const { store, getState } = createTestStore(setProps, 16, 10);
+      const panelId = getState().workspace.present.activePanelId;
+
+      await store.dispatch(addTab({ panelId: panelId as PanelId, name: 'Tab 1' }));
+      await store.dispatch(addTab({ panelId: panelId as PanelId, name: 'Tab 2' }));
+      expect(setProps).toHaveBeenCalledTimes(1);
+
+      vi.advanceTimersByTime(10);
+      expect(setProps).toHaveBeenCalledTimes(2);
+    });
   });
 
   describe('deduplication', () => {
@@ -7,7 +7,7 @@ import { resetWorkspace } from '../workspaceSlice';
 import { validateWorkspace } from '@utils/workspace';
 import { logger } from '@utils/logger';
 
-const DEBOUNCE_MS = 500;
+const DEFAULT_DEBOUNCE_MS = 500;
 
 /** Return type for createDashSyncMiddleware - includes cleanup function */
 export type DashSyncMiddlewareResult = {
@@ -22,15 +22,18 @@ export type DashSyncMiddlewareResult = {
  *
  * Features:
  * - First sync is immediate
- * - Subsequent syncs are debounced (500ms)
+ * - Subsequent syncs are debounced (500ms by default)
  * - Deduplication via serialization comparison
  * - Flushes on page unload
  * - Returns cleanup function to prevent memory leaks
  *
+ * @param setProps - Dash setProps callback
+ * @param debounceMs - Delay before a workspace change is synced to Dash
  * @returns Object with middleware and cleanup function
  */
 export function createDashSyncMiddleware(
-  setProps: ((props: Record<string, unknown>) => void) | undefined
+  setProps: ((props: Record<string, unknown>) => void) | undefined,
+  debounceMs: number = DEFAULT_DEBOUNCE_MS
 ): DashSyncMiddlewareResult {
   let lastSyncRef = '';
   let timeoutId: ReturnType<typeof setTimeout> | null = null;
@@ -115,7 +118,7 @@ export function createDashSyncMiddleware(
           doSync(workspace);
         } else {
           pendingWorkspace = workspace;
-          timeoutId = setTimeout(() => doSync(workspace), DEBOUNCE_MS);
+          timeoutId = setTimeout(() => doSync(workspace), debounceMs);
         }
 
         // Clean up searchBarModes when a panel is collapsed
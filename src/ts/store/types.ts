@@ -44,6 +44,8 @@ export type StoreConfig = {
   persistenceType: 'local' | 'session' | 'memory';
   maxTabs: number;
   setProps?: (props: Record<string, unknown>) => void;
+  /** Debounce in milliseconds for syncing workspace changes to readWorkspace */
+  readWorkspaceDebounceMs?: number;
   /** Getter for registered layouts — used by thunks to check constraints like allowMultiple */
   getRegisteredLayouts?: () => RegisteredLayouts;
 };
@@ -9,6 +9,16 @@ from dash import Dash, html
 import dash_prism
 
 
+def pytest_addoption(parser):
+    """Register dash_prism test options (must live in the root tests conftest)."""
+    parser.addoption(
+        "--reuse-dash-server",
+        action="store_true",
+        default=False,
+        help="Serve every integration test app from one server per worker.",
+    )
+
+
 @pytest.fixture
 def dash_app() -> Dash:
     """
@@ -4,19 +4,30 @@ Pytest configuration and fixtures for dash_prism integration tests.
 Integration tests use dash[testing]'s dash_duo fixture to test browser interactions.
 Following Dash Testing Best Practices:
 - Use explicit waits (wait_for_*) instead of time.sleep()
+- Never use implicit waits (forced to 0, see ``no_implicit_wait``)
 - Use reliable CSS selectors
 - Check for browser console errors
-- Keep tests isolated
+- Keep tests isolated (one shared browser per worker, reset between tests)
 
 Utility functions are defined in testutils.py.
 """
 
 from __future__ import annotations
 
+import ast
+import functools
+import os
 import socket
+import threading
+from pathlib import Path
+
 import pytest
 from dash import Dash, html, Input, Output
+from dash.testing.application_runners import ThreadedRunner
+from dash.testing.composite import DashComposite
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options
+from werkzeug.serving import make_server
 import dash_prism
 
 
@@ -43,30 +54,55 @@ from testutils import (
     SEARCHBAR_INPUT,
     CONTEXT_MENU,
     PRISM_ROOT,
+    TAB_BY_ID,
+    TAB_CLOSE_BUTTON,
+    TAB_RENAME_INPUT,
     DROP_ZONE_LEFT,
     DROP_ZONE_RIGHT,
     DROP_ZONE_TOP,
     DROP_ZONE_BOTTOM,
+    LAYOUT_ITEM_STATIC,
+    LAYOUT_ITEM_CALLBACK,
+    LOC_SEARCHBAR,
+    LOC_SEARCH_INPUT,
+    LOC_STATIC_ITEM,
+    LOC_CALLBACK_ITEM,
+    STRICT_USER_GESTURES,
+    action_selector,
     # Wait helpers
     wait_for_tab_count,
     wait_for_panel_count,
+    wait_for_all_present,
     wait_for_element_invisible,
+    wait_for_focus_lost,
+    wait_for_text,
     wait_for_drop_zones_visible,
     wait_for_panel_layout_stable,
+    resize_window,
     # Element getters
     get_tabs,
+    query_tabs,
+    tab_text_contains,
+    rename_committed,
     get_panels,
+    count_tabs,
+    count_panels,
     get_tab_id,
     get_panel_id,
     get_tab_order_in_panel,
     verify_tab_in_panel,
     are_drop_zones_present,
     check_browser_errors,
+    first_browser_error,
     # React interaction helpers
     trigger_rename_mode,
     set_input_value_react,
+    fast_type,
+    cdp_type,
+    open_search_and_type,
     press_enter_on_element,
     # Tab management
+    seed_tabs,
     create_tabs_for_dnd_test,
     # Drag-and-drop helpers
     perform_drag_and_drop,
@@ -78,21 +114,39 @@ from testutils import (
     # Common interaction helpers
     get_modifier_key,
     open_context_menu,
+    double_click,
+    wait_and_click,
+    press_key_cdp,
+    press_escape,
 )
 
-
 # =============================================================================
 # Chrome Performance Options for Faster Tests
 # =============================================================================
+# Set PRISM_HEADED=1 to watch the browser while debugging a test locally.
+HEADED = os.environ.get("PRISM_HEADED") == "1"
+
+
+def pytest_configure(config):
+    """Let PRISM_HEADED override the ``--headless`` flag from pytest addopts."""
+    if HEADED and hasattr(config.option, "headless"):
+        config.option.headless = False
+
+
 def pytest_setup_options():
     """
     Configure Chrome options for faster, more reliable headless testing.
 
     This hook is called by dash[testing] to configure the browser.
+
+    WebDriver commands already reuse one HTTP connection: Selenium 4's
+    Chrome driver creates its ``ChromiumRemoteConnection`` with
+    ``keep_alive=True`` by default, so no executor override is needed.
     """
     options = Options()
     # Use new headless mode which behaves more like regular Chrome
-    options.add_argument("--headless=new")
+    if not HEADED:
+        options.add_argument("--headless=new")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
@@ -100,14 +154,76 @@ def pytest_setup_options():
     options.add_argument("--disable-extensions")
     options.add_argument("--disable-infobars")
     options.add_argument("--disable-browser-side-navigation")
+    # Skip first-run, sync and background services that only slow Chrome startup
+    options.add_argument("--no-first-run")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--metrics-recording-only")
     # Headless stability flags for @dnd-kit pointer/mouse event handling
     options.add_argument("--force-device-scale-factor=1")
     options.add_argument("--disable-background-timer-throttling")
     options.add_argument("--disable-renderer-backgrounding")
     options.add_argument("--disable-backgrounding-occluded-windows")
+    # Tests assert on data-testid and text, never on pixels - skip image decoding.
+    # Images are disabled via content settings rather than Network.setBlockedURLs:
+    # blocked requests are logged as SEVERE and would trip check_browser_errors().
+    # (A "prefs" experimental option would not survive: dash[testing] replaces the
+    # whole "prefs" dict with its download settings when it launches Chrome.)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--mute-audio")
+    # Return from driver.get() at DOMContentLoaded instead of the window load event:
+    # dash[testing] then waits for #react-entry-point, and the helpers wait for the
+    # Prism elements they need, so nothing relies on late subresources having loaded.
+    options.page_load_strategy = "eager"
+    # Console capture: dash[testing] already sets goog:loggingPrefs={"browser": "SEVERE"}
+    # on every Chrome it launches, which is the minimum check_browser_errors() needs.
+    # It is deliberately not disabled - passing tests must still prove a clean console.
     return options
 
 
+@functools.lru_cache(maxsize=None)
+def _find_sleep_calls(path: Path) -> tuple[int, ...]:
+    """Return line numbers of ``time.sleep(...)`` calls in a test module."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    return tuple(
+        node.lineno
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "sleep"
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "time"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Warn about ``time.sleep`` in integration test modules.
+
+    Fixed sleeps slow the suite and hide races; use an explicit wait_for_*
+    helper instead.
+    """
+    warned = set()
+    for item in items:
+        if item.path in warned or item.get_closest_marker("integration") is None:
+            continue
+        warned.add(item.path)
+        for lineno in _find_sleep_calls(item.path):
+            item.warn(
+                pytest.PytestWarning(
+                    f"{item.path.name}:{lineno} uses time.sleep(); use an explicit wait instead"
+                )
+            )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report as ``item.rep_<phase>`` for teardown fixtures."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -123,21 +239,240 @@ def clear_registry_integration():
     dash_prism.clear_registry()
 
 
-def _start_prism_app(dash_duo, *, size: str = "md"):
+@pytest.fixture(autouse=True)
+def no_implicit_wait(request):
     """
-    Start a Dash app with Prism component and registered test layouts.
+    Disable WebDriver implicit waits for every dash_duo browser.
+
+    dash[testing] sets ``implicitly_wait(2)``, which stalls every
+    ``find_elements`` that legitimately matches nothing (e.g. inside a
+    WebDriverWait predicate or a "should be absent" check) for 2s. All waits
+    in this suite are explicit, so the implicit wait is forced to 0 and must
+    stay there.
+    """
+    if "dash_duo" not in request.fixturenames:
+        yield
+        return
+
+    driver = request.getfixturevalue("dash_duo").driver
+    driver.implicitly_wait(0)
+    yield
+    assert driver.timeouts.implicit_wait == 0, "Tests must not re-enable implicit waits"
+
+
+@pytest.fixture(autouse=True)
+def assert_clean_console(request):
+    """
+    Assert the browser console has no SEVERE entries once a test passes.
+
+    Console errors accumulate over the whole test, so a single log pull at
+    teardown covers what per-test ``check_browser_errors`` asserts did.
+    Requesting ``dash_duo`` here makes it tear down after this check.
+    """
+    if "dash_duo" not in request.fixturenames:
+        yield
+        return
+
+    dash_duo = request.getfixturevalue("dash_duo")
+    yield
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.passed:
+        errors = check_browser_errors(dash_duo)
+        assert len(errors) == 0, f"Browser console should have no errors: {errors}"
+
+
+def _reset_browser(driver) -> None:
+    """
+    Return a shared browser to a clean state between tests.
+
+    Closes extra windows, clears cookies and web storage for the current
+    origin, removes the ResizeObserver patch installed by ``_prepare_browser``,
+    drains leftover console entries and parks the browser on ``about:blank``
+    so the previous app stops running.
+    """
+    script_id = getattr(driver, "_prism_resize_script", None)
+    if script_id is not None:
+        driver.execute_cdp_cmd(
+            "Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id}
+        )
+        driver._prism_resize_script = None
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    driver.delete_all_cookies()
+    driver.execute_script(
+        "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+    )
+    driver.get("about:blank")
+    driver.get_log("browser")
+    driver.set_window_size(1920, 1080)
+
+
+class _SharedDriverComposite(DashComposite):
+    """
+    DashComposite that reuses one WebDriver per session (per xdist worker).
+
+    Chrome is only launched when the pool has no live driver. On exit the
+    upstream teardown always runs, with ``driver.quit`` masked so it leaves
+    the shared browser open, and the browser is then reset. A browser that
+    fails to reset is quit and dropped so the next test launches a fresh one.
+    """
+
+    def __init__(self, pool: dict, **kwargs):
+        self._pool = pool
+        super().__init__(**kwargs)
+
+    def get_webdriver(self):
+        if self._pool.get("driver") is None:
+            self._pool["driver"] = super().get_webdriver()
+        return self._pool["driver"]
+
+    def __exit__(self, exc_type, exc_val, traceback):
+        driver = self.driver
+        # Browser.__exit__ quits the driver before its own teardown; shadow quit
+        # on the instance so the rest of that teardown runs but the browser lives
+        driver.quit = lambda: None
+        try:
+            super().__exit__(exc_type, exc_val, traceback)
+        finally:
+            del driver.quit
+        try:
+            _reset_browser(driver)
+        except WebDriverException:
+            self._pool["driver"] = None
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+
+@pytest.fixture(scope="session")
+def _webdriver_pool():
+    """Hold the session's shared WebDriver and quit it when the session ends."""
+    pool = {"driver": None}
+    yield pool
+    if pool["driver"] is not None:
+        try:
+            pool["driver"].quit()
+        except WebDriverException:
+            pass
+
+
+class _SharedDashServer:
+    """
+    One threaded WSGI server per worker that serves the most recently started app.
+
+    Implements the part of ThreadedRunner that DashComposite uses (call to
+    start, ``url``, ``stop``). Tests in a worker run one at a time, so
+    swapping the active app replaces starting a Flask server per test.
+    """
+
+    def __init__(self):
+        self._app = None
+        self._httpd = make_server("localhost", 0, self._dispatch, threaded=True)
+        self.url = f"http://localhost:{self._httpd.server_port}"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def _dispatch(self, environ, start_response):
+        if self._app is None:
+            start_response("503 Service Unavailable", [("Content-Type", "text/plain")])
+            return [b"No Dash app started"]
+        return self._app(environ, start_response)
+
+    def __call__(self, app, **kwargs):
+        # The shared server owns the port; only dev-tools options still apply
+        dev_tools = {k: v for k, v in kwargs.items() if k == "debug" or k.startswith("dev_tools_")}
+        app.scripts.config.serve_locally = True
+        app.css.config.serve_locally = True
+        app.enable_dev_tools(**{"dev_tools_disable_version_check": True, **dev_tools})
+        self._app = app.server
+
+    def stop(self):
+        """Detach the current app; the server keeps running for the next test."""
+        self._app = None
+
+    def shutdown(self):
+        self._httpd.shutdown()
+
+
+@pytest.fixture(scope="session")
+def _shared_dash_server():
+    """Start the worker's shared Dash server on first use."""
+    server = _SharedDashServer()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def dash_thread_server(request):
+    """
+    Override dash[testing]'s ``dash_thread_server``.
+
+    By default a fresh ThreadedRunner is started per test, as upstream. With
+    ``--reuse-dash-server`` the worker's shared server is used instead.
+    """
+    if not request.config.getoption("reuse_dash_server"):
+        with ThreadedRunner() as starter:
+            yield starter
+        return
+
+    server = request.getfixturevalue("_shared_dash_server")
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def dash_duo(request, tmpdir, _webdriver_pool) -> DashComposite:
+    """
+    Override dash[testing]'s ``dash_duo`` to share one browser per worker.
+
+    Launching Chrome and handshaking with ChromeDriver costs ~1.5s per test;
+    the browser is instead reused and reset between tests. Each test still
+    gets its own server and composite, except that tests using
+    ``prism_app_with_layouts`` get no server at all. Arguments mirror the
+    upstream fixture.
+    """
+    # prism_app_with_layouts loads the session-served app, so no runner is set up
+    # (or torn down) for it. Checked against dash.testing from dash 4.4.1 (not the
+    # locked 3.4.0; re-check when bumping dash): DashComposite only uses ``server``
+    # in start_server, and the plugin's failure-snapshot hook finds the composite
+    # by the ``dash_duo`` funcarg name, which is why this stays one fixture.
+    if "prism_app_with_layouts" in request.fixturenames:
+        server = None
+    else:
+        server = request.getfixturevalue("dash_thread_server")
+
+    with _SharedDriverComposite(
+        _webdriver_pool,
+        server=server,
+        browser=request.config.getoption("webdriver"),
+        remote=request.config.getoption("remote"),
+        remote_url=request.config.getoption("remote_url"),
+        headless=request.config.getoption("headless"),
+        options=request.config.hook.pytest_setup_options(),
+        download_path=tmpdir.mkdir("download").strpath,
+        percy_assets_root=request.config.getoption("percy_assets"),
+        percy_finalize=request.config.getoption("nopercyfinalize"),
+        pause=request.config.getoption("pause"),
+    ) as dc:
+        yield dc
+
+
+def _build_prism_app(*, size: str = "md") -> Dash:
+    """
+    Build a Dash app with Prism component and registered test layouts.
 
     Parameters
     ----------
-    dash_duo : DashComposite
-        The dash[testing] fixture combining Dash server + browser.
     size : str
         Prism size variant ('sm', 'md', or 'lg').
 
     Returns
     -------
-    DashComposite
-        The dash_duo instance with app already started and loaded.
+    Dash
+        The initialized (not yet served) app.
     """
     app = Dash(__name__, suppress_callback_exceptions=True)
 
@@ -187,14 +522,39 @@ def _start_prism_app(dash_duo, *, size: str = "md"):
     # Initialize Prism with callbacks
     dash_prism.init("prism", app)
 
-    # Get a free port to avoid conflicts in parallel test execution
-    port = get_free_port()
+    return app
 
+
+def _prepare_browser(dash_duo) -> None:
+    """
+    Patch ResizeObserver and fix the window size before the app is loaded.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash[testing] fixture combining Dash server + browser.
+    """
     # CRITICAL: Inject ResizeObserver patch BEFORE app mount via Chrome DevTools Protocol
     # This ensures all observers created during React mount use the patched implementation.
     # The previous approach of patching after start_server() was too late - react-split-pane
     # creates its observers during initial mount and never picks up the post-hoc patch.
-    dash_duo.driver.execute_cdp_cmd(
+    # The browser is shared across tests; _reset_browser removes the script again so
+    # tests that don't call this helper never inherit the patch.
+    driver = dash_duo.driver
+    if getattr(driver, "_prism_resize_script", None) is None:
+        driver._prism_resize_script = _add_resize_observer_patch(driver)
+
+    # Explicitly set window size BEFORE server start (critical for headless mode!)
+    driver.set_window_size(1920, 1080)
+
+
+def _add_resize_observer_patch(driver) -> str:
+    """
+    Register the ResizeObserver patch to run before any page script.
+
+    Returns the CDP script identifier, needed to remove the patch again.
+    """
+    result = driver.execute_cdp_cmd(
         "Page.addScriptToEvaluateOnNewDocument",
         {"source": """
             (function() {
@@ -252,9 +612,31 @@ def _start_prism_app(dash_duo, *, size: str = "md"):
             })();
             """},
     )
+    return result["identifier"]
 
-    # Explicitly set window size BEFORE server start (critical for headless mode!)
-    dash_duo.driver.set_window_size(1920, 1080)
+
+def _start_prism_app(dash_duo, *, size: str = "md"):
+    """
+    Start a Dash app with Prism component and registered test layouts.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash[testing] fixture combining Dash server + browser.
+    size : str
+        Prism size variant ('sm', 'md', or 'lg').
+
+    Returns
+    -------
+    DashComposite
+        The dash_duo instance with app already started and loaded.
+    """
+    app = _build_prism_app(size=size)
+
+    # Get a free port to avoid conflicts in parallel test execution
+    port = get_free_port()
+
+    _prepare_browser(dash_duo)
 
     # Start server on the dynamically assigned port
     dash_duo.start_server(app, port=port)
@@ -265,22 +647,62 @@ def _start_prism_app(dash_duo, *, size: str = "md"):
     return dash_duo
 
 
+@pytest.fixture(scope="session")
+def prism_server():
+    """
+    Serve the default Prism test app once per session (per xdist worker).
+
+    Flask startup and ``init`` run once; tests only load the page in the
+    worker browser. The registered layouts are snapshotted so they can be restored
+    after ``clear_registry_integration`` wipes the registry for each test.
+
+    Yields
+    ------
+    tuple[str, dict]
+        The server URL and the registered layouts snapshot.
+    """
+    dash_prism.clear_registry()
+    app = _build_prism_app(size="md")
+    layouts = dash_prism.registry.layouts
+    dash_prism.clear_registry()
+
+    runner = ThreadedRunner()
+    runner.start(app, port=get_free_port())
+    try:
+        yield runner.url, layouts
+    finally:
+        runner.stop()
+
+
 @pytest.fixture
-def prism_app_with_layouts(dash_duo):
+def prism_app_with_layouts(dash_duo, prism_server):
     """
-    Create a Dash app with Prism component and registered test layouts.
+    Load the shared Prism test app in the (reset) shared browser.
+
+    The app is served by ``prism_server``, so ``dash_duo`` is built without a
+    server for these tests and ``start_server`` must not be called on it.
 
     Parameters
     ----------
     dash_duo : DashComposite
         The dash[testing] fixture combining Dash server + browser.
+    prism_server : tuple[str, dict]
+        Session-scoped server URL and registered layouts snapshot.
 
     Returns
     -------
     DashComposite
-        The dash_duo instance with app already started and loaded.
+        The dash_duo instance with the app loaded.
     """
-    return _start_prism_app(dash_duo, size="md")
+    url, layouts = prism_server
+    for registration in layouts.values():
+        dash_prism.registry.register(registration)
+
+    _prepare_browser(dash_duo)
+    # Setting server_url navigates and waits for the Dash renderer
+    dash_duo.server_url = url
+    dash_duo.driver.execute_script("window.dispatchEvent(new Event('resize'));")
+    return dash_duo
 
 
 @pytest.fixture
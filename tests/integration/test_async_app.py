@@ -16,21 +16,22 @@ from __future__ import annotations
 
 import pytest
 from dash import Dash, html
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 import dash_prism
 
 from conftest import (
-    TAB_SELECTOR,
     ADD_TAB_BUTTON,
     SEARCHBAR_INPUT,
     wait_for_tab_count,
     get_tabs,
-    check_browser_errors,
+    first_browser_error,
     get_free_port,
+    wait_and_click,
+    cdp_type,
+    tab_text_contains,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def _start_async_prism_app(dash_duo):
@@ -169,8 +170,8 @@ def test_async_app_renders_initial_tab(dash_duo):
     tabs = get_tabs(duo)
     assert len(tabs) == 1, "Should start with 1 tab in async mode"
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors in async mode: {errors}"
+    error = first_browser_error(duo)
+    assert error is None, f"No browser errors in async mode: {error}"
 
 
 def test_async_app_static_layout_works(dash_duo):
@@ -179,25 +180,19 @@ def test_async_app_static_layout_works(dash_duo):
     wait_for_tab_count(duo, 1)
 
     # Open SearchBar and select the static layout
-    duo.wait_for_element(".prism-searchbar", timeout=5)
-    duo.find_element(".prism-searchbar").click()
+    wait_and_click(duo, ".prism-searchbar", timeout=5)
     duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    duo.find_element(SEARCHBAR_INPUT).send_keys("Static")
+    cdp_type(duo, SEARCHBAR_INPUT, "Static")
 
-    duo.wait_for_element("[data-testid='prism-layout-item-static-async']", timeout=5)
-    duo.find_element("[data-testid='prism-layout-item-static-async']").click()
+    wait_and_click(duo, "[data-testid='prism-layout-item-static-async']", timeout=5)
 
     # Verify content rendered
     duo.wait_for_element("[id*='static-async-content']", timeout=10)
 
-    def tab_shows_name(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return any("Static Async Layout" in t.text for t in tabs)
+    WebDriverWait(duo.driver, 5).until(tab_text_contains("Static Async Layout"))
 
-    WebDriverWait(duo.driver, 5).until(tab_shows_name)
-
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors: {errors}"
+    error = first_browser_error(duo)
+    assert error is None, f"No browser errors: {error}"
 
 
 def test_async_callback_layout_renders(dash_duo):
@@ -206,25 +201,19 @@ def test_async_callback_layout_renders(dash_duo):
     wait_for_tab_count(duo, 1)
 
     # Open SearchBar and select the async greeting layout
-    duo.wait_for_element(".prism-searchbar", timeout=5)
-    duo.find_element(".prism-searchbar").click()
+    wait_and_click(duo, ".prism-searchbar", timeout=5)
     duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    duo.find_element(SEARCHBAR_INPUT).send_keys("Async Greeting")
+    cdp_type(duo, SEARCHBAR_INPUT, "Async Greeting")
 
-    duo.wait_for_element("[data-testid='prism-layout-item-async-greeting']", timeout=5)
-    duo.find_element("[data-testid='prism-layout-item-async-greeting']").click()
+    wait_and_click(duo, "[data-testid='prism-layout-item-async-greeting']", timeout=5)
 
     # Verify the async callback content was rendered
     duo.wait_for_element("[id*='async-greeting-content']", timeout=10)
 
-    def tab_shows_name(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return any("Async Greeting" in t.text for t in tabs)
-
-    WebDriverWait(duo.driver, 5).until(tab_shows_name)
+    WebDriverWait(duo.driver, 5).until(tab_text_contains("Async Greeting"))
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors: {errors}"
+    error = first_browser_error(duo)
+    assert error is None, f"No browser errors: {error}"
 
 
 def test_async_app_tab_creation(dash_duo):
@@ -240,5 +229,5 @@ def test_async_app_tab_creation(dash_duo):
     tabs = get_tabs(duo)
     assert len(tabs) == 2, "Should have 2 tabs in async mode"
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors: {errors}"
+    error = first_browser_error(duo)
+    assert error is None, f"No browser errors: {error}"
@@ -24,12 +24,12 @@ from conftest import (
     ADD_TAB_BUTTON,
     wait_for_tab_count,
     get_tabs,
-    check_browser_errors,
+    first_browser_error,
     get_free_port,
 )
 
 # Mark all tests in this module as integration tests
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def test_static_layout_integration(dash_duo):
@@ -92,8 +92,8 @@ def test_static_layout_integration(dash_duo):
     assert len(tabs) == 2, "Should have 2 tabs after clicking add"
 
     # Check for browser console errors
-    errors = check_browser_errors(dash_duo)
-    assert len(errors) == 0, f"Browser console should have no errors: {errors}"
+    error = first_browser_error(dash_duo)
+    assert error is None, f"Browser console should have no errors: {error}"
 
 
 def test_callable_layout_integration(dash_duo):
@@ -161,5 +161,5 @@ def test_callable_layout_integration(dash_duo):
     assert len(tabs) == 2, "Should have 2 tabs after clicking add"
 
     # Check for browser console errors
-    errors = check_browser_errors(dash_duo)
-    assert len(errors) == 0, f"Browser console should have no errors: {errors}"
+    error = first_browser_error(dash_duo)
+    assert error is None, f"Browser console should have no errors: {error}"
@@ -16,20 +16,21 @@ from __future__ import annotations
 import pytest
 from dash import Dash, html
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.common.by import By
 import dash_prism
 
 from conftest import (
-    TAB_SELECTOR,
     SEARCHBAR_INPUT,
     PRISM_ROOT,
     wait_for_tab_count,
     get_tabs,
-    check_browser_errors,
+    first_browser_error,
     get_free_port,
+    wait_and_click,
+    cdp_type,
+    tab_text_contains,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def _start_app_with_callback_layouts(dash_duo):
@@ -99,33 +100,25 @@ def test_callback_layout_renders_content(dash_duo):
     wait_for_tab_count(duo, 1)
 
     # Open search bar and select the "Greeting" callback layout
-    duo.wait_for_element(".prism-searchbar", timeout=5)
-    searchbar = duo.find_element(".prism-searchbar")
-    searchbar.click()
+    wait_and_click(duo, ".prism-searchbar", timeout=5)
 
     duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    search_input = duo.find_element(SEARCHBAR_INPUT)
-    search_input.send_keys("Greeting")
+    cdp_type(duo, SEARCHBAR_INPUT, "Greeting")
 
     # Wait for the layout item to appear and click it
-    duo.wait_for_element("[data-testid='prism-layout-item-greeting']", timeout=5)
-    duo.find_element("[data-testid='prism-layout-item-greeting']").click()
+    wait_and_click(duo, "[data-testid='prism-layout-item-greeting']", timeout=5)
 
     # Verify the callback layout content is rendered
     # Note: inject_tab_id transforms ids, so use contains selector
     duo.wait_for_element("[id*='greeting-content']", timeout=10)
 
     # Tab name should be "Greeting"
-    def tab_shows_greeting(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return any("Greeting" in t.text for t in tabs)
-
     WebDriverWait(duo.driver, 5).until(
-        tab_shows_greeting, message="Tab should show 'Greeting' layout name"
+        tab_text_contains("Greeting"), message="Tab should show 'Greeting' layout name"
     )
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
+    error = first_browser_error(duo)
+    assert error is None, f"No browser errors expected: {error}"
 
 
 def test_static_and_callback_layouts_coexist(dash_duo):
@@ -135,23 +128,17 @@ def test_static_and_callback_layouts_coexist(dash_duo):
     wait_for_tab_count(duo, 1)
 
     # Open the static layout first
-    duo.wait_for_element(".prism-searchbar", timeout=5)
-    duo.find_element(".prism-searchbar").click()
+    wait_and_click(duo, ".prism-searchbar", timeout=5)
     duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    duo.find_element(SEARCHBAR_INPUT).send_keys("Static")
+    cdp_type(duo, SEARCHBAR_INPUT, "Static")
 
-    duo.wait_for_element("[data-testid='prism-layout-item-static']", timeout=5)
-    duo.find_element("[data-testid='prism-layout-item-static']").click()
+    wait_and_click(duo, "[data-testid='prism-layout-item-static']", timeout=5)
 
     # Wait for static content
     duo.wait_for_element("[id*='static-content']", timeout=10)
 
     # Verify we have 1 tab with the static layout
-    def tab_shows_static(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return any("Static Page" in t.text for t in tabs)
-
-    WebDriverWait(duo.driver, 5).until(tab_shows_static)
+    WebDriverWait(duo.driver, 5).until(tab_text_contains("Static Page"))
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
+    error = first_browser_error(duo)
+    assert error is None, f"No browser errors expected: {error}"
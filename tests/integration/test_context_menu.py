@@ -14,8 +14,6 @@ Best Practices Applied:
 from __future__ import annotations
 
 import pytest
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
 
 from conftest import (
     TAB_SELECTOR,
@@ -25,29 +23,12 @@ from conftest import (
     wait_for_tab_count,
     wait_for_element_invisible,
     open_context_menu,
+    press_escape,
+    count_tabs,
 )
 
 # Mark all tests in this module as integration tests
-pytestmark = pytest.mark.integration
-
-
-def test_context_menu_appears_on_right_click(prism_app_with_layouts):
-    """Test that context menu appears on right-click."""
-    duo = prism_app_with_layouts
-
-    # Right-click tab
-    tab = duo.find_element(TAB_SELECTOR)
-    open_context_menu(duo, tab)
-
-    # Verify menu appears
-    context_menu = duo.find_element(CONTEXT_MENU)
-    assert context_menu.is_displayed(), "Context menu should be visible"
-
-    # Press Escape to close menu
-    ActionChains(duo.driver).send_keys(Keys.ESCAPE).perform()
-
-    # Wait for menu to close (explicit wait)
-    wait_for_element_invisible(duo, CONTEXT_MENU, timeout=2)
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def test_context_menu_close(prism_app_with_layouts):
@@ -99,7 +80,7 @@ def test_context_menu_has_expected_items(prism_app_with_layouts):
         assert len(elements) > 0, f"Menu item {selector} should exist"
 
     # Close menu
-    ActionChains(duo.driver).send_keys(Keys.ESCAPE).perform()
+    press_escape(duo)
 
 
 def test_context_menu_duplicate_creates_new_tab(prism_app_with_layouts):
@@ -107,7 +88,7 @@ def test_context_menu_duplicate_creates_new_tab(prism_app_with_layouts):
     duo = prism_app_with_layouts
 
     # Verify starting with 1 tab
-    initial_count = len(get_tabs(duo))
+    initial_count = count_tabs(duo)
     assert initial_count == 1, "Should start with 1 tab"
 
     # Right-click tab
@@ -126,8 +107,8 @@ def test_context_menu_duplicate_creates_new_tab(prism_app_with_layouts):
     assert len(tabs) == 2, "Duplicate should create new tab"
 
 
-def test_context_menu_closes_on_escape(prism_app_with_layouts):
-    """Test that pressing Escape closes the context menu."""
+def test_context_menu_opens_and_closes_on_escape(prism_app_with_layouts):
+    """Test that right-click opens the context menu and Escape closes it."""
     duo = prism_app_with_layouts
 
     # Right-click tab
@@ -139,7 +120,7 @@ def test_context_menu_closes_on_escape(prism_app_with_layouts):
     assert context_menu.is_displayed(), "Context menu should be visible"
 
     # Press Escape
-    ActionChains(duo.driver).send_keys(Keys.ESCAPE).perform()
+    press_escape(duo)
 
     # Wait for menu to close
     wait_for_element_invisible(duo, CONTEXT_MENU, timeout=2)
@@ -17,9 +17,7 @@ from __future__ import annotations
 import pytest
 
 from conftest import (
-    get_tabs,
-    get_panels,
-    check_browser_errors,
+    first_browser_error,
     create_tabs_for_dnd_test,
     start_drag_without_drop,
     cancel_drag_with_escape,
@@ -30,9 +28,11 @@ from conftest import (
     wait_for_tab_count,
     wait_for_element_invisible,
     DROP_ZONE_LEFT,
+    count_tabs,
+    count_panels,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 class TestDropZoneBehavior:
@@ -47,7 +47,7 @@ class TestDropZoneBehavior:
         duo = prism_app_with_layouts
 
         # Verify single tab mode
-        assert len(get_tabs(duo)) == 1, "Should start with 1 tab"
+        assert count_tabs(duo) == 1, "Should start with 1 tab"
         assert not are_drop_zones_present(duo), "No drop zones in single-tab mode"
 
         # Even during drag attempt, no drop zones
@@ -58,8 +58,8 @@ class TestDropZoneBehavior:
         finally:
             cancel_drag_with_escape(duo)
 
-        errors = check_browser_errors(duo)
-        assert len(errors) == 0, f"No browser errors expected: {errors}"
+        error = first_browser_error(duo)
+        assert error is None, f"No browser errors expected: {error}"
 
     def test_multi_tab_drop_zones_appear(self, prism_app_with_layouts):
         """
@@ -83,8 +83,8 @@ class TestDropZoneBehavior:
         wait_for_element_invisible(duo, DROP_ZONE_LEFT, timeout=5.0)
         assert not are_drop_zones_present(duo), "Drop zones should disappear"
 
-        errors = check_browser_errors(duo)
-        assert len(errors) == 0, f"No browser errors expected: {errors}"
+        error = first_browser_error(duo)
+        assert error is None, f"No browser errors expected: {error}"
 
 
 class TestDragCancellation:
@@ -109,7 +109,7 @@ class TestDragCancellation:
         # Tab order unchanged
         final_order = get_tab_order_in_panel(duo, 0)
         assert final_order == initial_order, "Order should be unchanged after cancel"
-        assert len(get_panels(duo)) == 1, "Panel count unchanged"
+        assert count_panels(duo) == 1, "Panel count unchanged"
 
-        errors = check_browser_errors(duo)
-        assert len(errors) == 0, f"No browser errors expected: {errors}"
+        error = first_browser_error(duo)
+        assert error is None, f"No browser errors expected: {error}"
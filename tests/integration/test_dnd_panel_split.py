@@ -20,17 +20,17 @@ from __future__ import annotations
 import pytest
 
 from conftest import (
-    get_tabs,
-    get_panels,
     get_panel_id,
-    check_browser_errors,
+    first_browser_error,
     create_tabs_for_dnd_test,
     drag_tab_to_panel_edge,
     get_tab_order_in_panel,
     wait_for_panel_count,
+    count_tabs,
+    count_panels,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 class TestPanelSplit:
@@ -52,8 +52,8 @@ class TestPanelSplit:
 
         # Create 3 tabs (need 2+ to enable DnD and allow split)
         create_tabs_for_dnd_test(duo, 3)
-        assert len(get_tabs(duo)) == 3, "Should have 3 tabs for DnD test"
-        assert len(get_panels(duo)) == 1, "Should start with 1 panel"
+        assert count_tabs(duo) == 3, "Should have 3 tabs for DnD test"
+        assert count_panels(duo) == 1, "Should start with 1 panel"
 
         # Drag to specified edge to split
         result = drag_tab_to_panel_edge(duo, 1, edge)
@@ -63,11 +63,11 @@ class TestPanelSplit:
         wait_for_panel_count(duo, 2, timeout=10.0)
 
         # Verify 2 panels and 3 tabs
-        assert len(get_panels(duo)) == 2, "Should have 2 panels after split"
-        assert len(get_tabs(duo)) == 3, "Should still have 3 tabs total"
+        assert count_panels(duo) == 2, "Should have 2 panels after split"
+        assert count_tabs(duo) == 3, "Should still have 3 tabs total"
 
-        errors = check_browser_errors(duo)
-        assert len(errors) == 0, f"No browser errors expected: {errors}"
+        error = first_browser_error(duo)
+        assert error is None, f"No browser errors expected: {error}"
 
     def test_split_moves_only_dragged_tab(self, prism_app_with_layouts):
         """
@@ -97,8 +97,8 @@ class TestPanelSplit:
         tab_counts = sorted([len(panel0_tabs), len(panel1_tabs)])
         assert tab_counts == [1, 2], f"Expected [1, 2] distribution, got {tab_counts}"
 
-        errors = check_browser_errors(duo)
-        assert len(errors) == 0, f"No browser errors expected: {errors}"
+        error = first_browser_error(duo)
+        assert error is None, f"No browser errors expected: {error}"
 
     def test_split_preserves_original_panel_id(self, prism_app_with_layouts):
         """
@@ -132,15 +132,15 @@ class TestPanelSplit:
         # First split
         drag_tab_to_panel_edge(duo, 1, "right")
         wait_for_panel_count(duo, 2, timeout=10.0)
-        assert len(get_panels(duo)) == 2, "Should have 2 panels after first split"
+        assert count_panels(duo) == 2, "Should have 2 panels after first split"
 
         # Second split from first panel
         drag_tab_to_panel_edge(duo, 0, "bottom", source_panel_index=0)
         wait_for_panel_count(duo, 3, timeout=10.0)
 
         # Verify state
-        assert len(get_panels(duo)) >= 2, "Should have at least 2 panels"
-        assert len(get_tabs(duo)) == 4, "Should still have 4 tabs"
+        assert count_panels(duo) >= 2, "Should have at least 2 panels"
+        assert count_tabs(duo) == 4, "Should still have 4 tabs"
 
-        errors = check_browser_errors(duo)
-        assert len(errors) == 0, f"No browser errors expected: {errors}"
+        error = first_browser_error(duo)
+        assert error is None, f"No browser errors expected: {error}"
@@ -17,17 +17,17 @@ from __future__ import annotations
 import pytest
 
 from conftest import (
-    get_tabs,
-    get_panels,
-    check_browser_errors,
+    first_browser_error,
     create_tabs_for_dnd_test,
     drag_tab_to_position,
     get_tab_order_in_panel,
     wait_for_tab_count,
     ADD_TAB_BUTTON,
+    count_tabs,
+    count_panels,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 class TestTabReorder:
@@ -62,15 +62,18 @@ class TestTabReorder:
 
         # All tabs preserved
         assert set(new_order) == set(initial_order), "All tabs should exist"
-        assert len(get_tabs(duo)) == 3, "Still 3 tabs"
-        assert len(get_panels(duo)) == 1, "Still 1 panel"
+        assert count_tabs(duo) == 3, "Still 3 tabs"
+        assert count_panels(duo) == 1, "Still 1 panel"
 
-        errors = check_browser_errors(duo)
-        assert len(errors) == 0, f"No browser errors expected: {errors}"
+        error = first_browser_error(duo)
+        assert error is None, f"No browser errors expected: {error}"
 
     def test_reorder_with_two_tabs(self, prism_app_with_layouts):
         """
         Test reordering with exactly 2 tabs (minimum for DnD).
+
+        Driven by real WebDriver input so the reorder path is not only
+        exercised through synthetic in-page pointer events.
         """
         duo = prism_app_with_layouts
 
@@ -79,15 +82,15 @@ class TestTabReorder:
 
         initial_order = get_tab_order_in_panel(duo, 0)
 
-        result = drag_tab_to_position(duo, 0, 1)
+        result = drag_tab_to_position(duo, 0, 1, real_input=True)
         assert result, "Drag operation should complete"
 
         new_order = get_tab_order_in_panel(duo, 0)
         assert len(new_order) == 2, "Still 2 tabs"
         assert set(new_order) == set(initial_order), "Same tabs exist"
 
-        errors = check_browser_errors(duo)
-        assert len(errors) == 0, f"No browser errors expected: {errors}"
+        error = first_browser_error(duo)
+        assert error is None, f"No browser errors expected: {error}"
 
     def test_multiple_sequential_reorders(self, prism_app_with_layouts):
         """
@@ -106,7 +109,7 @@ class TestTabReorder:
         final_order = get_tab_order_in_panel(duo, 0)
 
         assert set(final_order) == initial_tabs, "All tabs preserved"
-        assert len(get_panels(duo)) == 1, "Still 1 panel"
+        assert count_panels(duo) == 1, "Still 1 panel"
 
-        errors = check_browser_errors(duo)
-        assert len(errors) == 0, f"No browser errors expected: {errors}"
+        error = first_browser_error(duo)
+        assert error is None, f"No browser errors expected: {error}"
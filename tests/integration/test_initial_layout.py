@@ -17,20 +17,19 @@ from __future__ import annotations
 import pytest
 from dash import Dash, html
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.common.by import By
 import dash_prism
 
 from conftest import (
-    TAB_SELECTOR,
+    tab_text_contains,
     ADD_TAB_BUTTON,
     PRISM_ROOT,
     wait_for_tab_count,
     get_tabs,
-    check_browser_errors,
+    first_browser_error,
 )
 
 # Mark all tests in this module as integration tests
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def test_initial_layout_applied_on_fresh_workspace(dash_duo):
@@ -77,14 +76,8 @@ def test_initial_layout_applied_on_fresh_workspace(dash_duo):
     assert len(tabs) == 1, "Should have 1 tab"
 
     # Wait for the tab name to update from "New Tab" to "Home Dashboard"
-    def tab_has_layout_name(driver):
-        tab_elements = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        if not tab_elements:
-            return False
-        return "Home Dashboard" in tab_elements[0].text
-
     WebDriverWait(dash_duo.driver, 10).until(
-        tab_has_layout_name,
+        tab_text_contains("Home Dashboard"),
         message="First tab should be named 'Home Dashboard' from initialLayout",
     )
 
@@ -93,8 +86,8 @@ def test_initial_layout_applied_on_fresh_workspace(dash_duo):
     # like {"type":"home-content","index":"<tabId>"}, so use attribute-contains selector
     dash_duo.wait_for_element("[id*='home-content']", timeout=10)
 
-    errors = check_browser_errors(dash_duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
+    error = first_browser_error(dash_duo)
+    assert error is None, f"No browser errors expected: {error}"
 
 
 def test_initial_layout_ignored_with_persistence(dash_duo):
@@ -132,14 +125,8 @@ def test_initial_layout_ignored_with_persistence(dash_duo):
     dash_duo.wait_for_element(PRISM_ROOT, timeout=10)
 
     # With memory persistence (fresh workspace), initialLayout should apply
-    def tab_has_layout_name(driver):
-        tab_elements = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        if not tab_elements:
-            return False
-        return "Home Dashboard" in tab_elements[0].text
-
     WebDriverWait(dash_duo.driver, 10).until(
-        tab_has_layout_name,
+        tab_text_contains("Home Dashboard"),
         message="First tab should show 'Home Dashboard' with memory persistence (fresh workspace)",
     )
 
@@ -180,8 +167,8 @@ def test_initial_layout_without_prop_shows_new_tab(dash_duo):
         "New Tab" in tabs[0].text
     ), f"Without initialLayout, tab should be 'New Tab', got '{tabs[0].text}'"
 
-    errors = check_browser_errors(dash_duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
+    error = first_browser_error(dash_duo)
+    assert error is None, f"No browser errors expected: {error}"
 
 
 def test_initial_layout_new_tabs_still_empty(dash_duo):
@@ -212,13 +199,7 @@ def test_initial_layout_new_tabs_still_empty(dash_duo):
     dash_duo.wait_for_element(PRISM_ROOT, timeout=10)
 
     # Wait for first tab to get the initial layout
-    def tab_has_layout_name(driver):
-        tab_elements = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        if not tab_elements:
-            return False
-        return "Home Dashboard" in tab_elements[0].text
-
-    WebDriverWait(dash_duo.driver, 10).until(tab_has_layout_name)
+    WebDriverWait(dash_duo.driver, 10).until(tab_text_contains("Home Dashboard"))
 
     # Add a second tab
     add_button = dash_duo.find_element(ADD_TAB_BUTTON)
@@ -23,7 +23,7 @@ from conftest import (
 )
 
 # Mark all tests in this module as integration tests
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def test_keyboard_shortcut_new_tab(prism_app_with_layouts):
@@ -19,7 +19,6 @@ that refresh is correctly hidden/disabled in that case.
 from __future__ import annotations
 
 import pytest
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
 from conftest import (
@@ -30,10 +29,12 @@ from conftest import (
     wait_for_element_invisible,
     get_modifier_key,
     open_context_menu,
+    press_key_cdp,
+    press_escape,
 )
 
 # Mark all tests in this module as integration tests
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def test_context_menu_refresh_hidden_without_layout(prism_app_with_layouts):
@@ -49,7 +50,7 @@ def test_context_menu_refresh_hidden_without_layout(prism_app_with_layouts):
     assert len(refresh_items) == 0, "Refresh menu item should be hidden for tabs without layout"
 
     # Close menu
-    ActionChains(duo.driver).send_keys(Keys.ESCAPE).perform()
+    press_escape(duo)
     wait_for_element_invisible(duo, CONTEXT_MENU, timeout=2)
 
 
@@ -72,7 +73,7 @@ def test_context_menu_has_core_items(prism_app_with_layouts):
         assert len(elements) > 0, f"Menu item {selector} should exist"
 
     # Close menu
-    ActionChains(duo.driver).send_keys(Keys.ESCAPE).perform()
+    press_escape(duo)
     wait_for_element_invisible(duo, CONTEXT_MENU, timeout=2)
 
 
@@ -88,11 +89,7 @@ def test_keyboard_shortcut_refresh_no_error(prism_app_with_layouts):
     # For tabs without layout, this should be a no-op (guarded in reducer)
     modifier = get_modifier_key()
 
-    # Use ActionChains for modifier combination
-    actions = ActionChains(duo.driver)
-    actions.key_down(modifier).key_down(Keys.SHIFT).send_keys("r").key_up(Keys.SHIFT).key_up(
-        modifier
-    ).perform()
+    press_key_cdp(duo, "R", "KeyR", 82, modifiers=(modifier, Keys.SHIFT))
 
     # Tab count should remain the same (refresh doesn't close tab)
     wait_for_tab_count(duo, len(tabs), timeout=3)
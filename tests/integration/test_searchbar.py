@@ -13,30 +13,30 @@ Best Practices Applied:
 
 from __future__ import annotations
 
-import time
-
 import pytest
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.common.exceptions import NoSuchElementException
 
 # Import helpers from conftest
 from conftest import (
     SEARCHBAR_INPUT,
+    LOC_SEARCHBAR,
+    LOC_SEARCH_INPUT,
     TAB_SELECTOR,
     ADD_TAB_BUTTON,
     PRISM_ROOT,
     wait_for_tab_count,
+    wait_for_all_present,
+    wait_for_focus_lost,
     get_tabs,
-    check_browser_errors,
+    seed_tabs,
+    fast_type,
+    resize_window,
 )
 
 # Mark all tests in this module as integration tests
-pytestmark = pytest.mark.integration
-
-# Short pause for UI animations/transitions (honest about what it does)
-_UI_SETTLE_MS = 0.3
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def test_searchbar_exists_on_initial_load(prism_app_with_layouts):
@@ -55,13 +55,9 @@ def test_searchbar_exists_on_initial_load(prism_app_with_layouts):
     # SearchBar should be present (either as display or search mode)
     # Check for the container that always exists
     duo.wait_for_element(".prism-searchbar", timeout=5)
-    searchbar = duo.find_element(".prism-searchbar")
+    searchbar = duo.driver.find_element(*LOC_SEARCHBAR)
     assert searchbar is not None, "SearchBar should render on initial load"
 
-    # No browser errors
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No console errors on initial load: {errors}"
-
 
 def test_searchbar_transitions_to_search_mode(prism_app_with_layouts):
     """
@@ -76,18 +72,15 @@ def test_searchbar_transitions_to_search_mode(prism_app_with_layouts):
 
     # Click on SearchBar (click on the container)
     duo.wait_for_element(".prism-searchbar", timeout=5)
-    searchbar = duo.find_element(".prism-searchbar")
+    searchbar = duo.driver.find_element(*LOC_SEARCHBAR)
     searchbar.click()
 
     # Search input should become visible (explicit wait)
     duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    search_input = duo.find_element(SEARCHBAR_INPUT)
+    search_input = duo.driver.find_element(*LOC_SEARCH_INPUT)
     assert search_input is not None, "Search input should appear"
     assert search_input.is_displayed(), "Search input should be visible"
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Mode transition should not cause errors: {errors}"
-
 
 def test_searchbar_escape_closes_dropdown(prism_app_with_layouts):
     """
@@ -102,22 +95,18 @@ def test_searchbar_escape_closes_dropdown(prism_app_with_layouts):
 
     # Activate search mode
     duo.wait_for_element(".prism-searchbar", timeout=5)
-    searchbar = duo.find_element(".prism-searchbar")
+    searchbar = duo.driver.find_element(*LOC_SEARCHBAR)
     searchbar.click()
 
     # Wait for search input
     duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    search_input = duo.find_element(SEARCHBAR_INPUT)
+    search_input = duo.driver.find_element(*LOC_SEARCH_INPUT)
 
     # Press Escape
     search_input.send_keys(Keys.ESCAPE)
 
-    # Wait for search input to disappear
-    time.sleep(_UI_SETTLE_MS)
-
-    # Verify no console errors
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Escape key should not cause errors: {errors}"
+    # Escape dismisses the dropdown and blurs the input
+    wait_for_focus_lost(duo, SEARCHBAR_INPUT)
 
 
 def test_searchbar_typing_updates_query(prism_app_with_layouts):
@@ -134,26 +123,21 @@ def test_searchbar_typing_updates_query(prism_app_with_layouts):
 
     # Activate search mode
     duo.wait_for_element(".prism-searchbar", timeout=5)
-    searchbar = duo.find_element(".prism-searchbar")
+    searchbar = duo.driver.find_element(*LOC_SEARCHBAR)
     searchbar.click()
 
-    # Wait for search input
+    # Wait for search input (auto-focused on open)
     duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    search_input = duo.find_element(SEARCHBAR_INPUT)
 
     # Type a query
-    search_input.send_keys("test")
+    fast_type(duo, "test")
 
     # Verify the input value was set
     WebDriverWait(duo.driver, 2).until(
-        lambda d: d.find_element(By.CSS_SELECTOR, SEARCHBAR_INPUT).get_attribute("value") == "test",
+        lambda d: d.find_element(*LOC_SEARCH_INPUT).get_attribute("value") == "test",
         message="Search input should contain 'test' after typing",
     )
 
-    # Verify no errors
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Typing should not cause errors: {errors}"
-
 
 def test_searchbar_independent_per_tab(prism_app_with_layouts):
     """
@@ -186,10 +170,6 @@ def test_searchbar_independent_per_tab(prism_app_with_layouts):
     tabs[1].click()
     duo.wait_for_element(".prism-searchbar", timeout=3)
 
-    # No errors during tab switching
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Tab switching should not cause errors: {errors}"
-
 
 def test_searchbar_rapid_interactions(prism_app_with_layouts):
     """
@@ -206,26 +186,21 @@ def test_searchbar_rapid_interactions(prism_app_with_layouts):
 
     # Rapid sequence: click -> type -> escape -> click -> type -> escape
     for _ in range(3):
-        searchbar = duo.find_element(".prism-searchbar")
+        searchbar = duo.driver.find_element(*LOC_SEARCHBAR)
         searchbar.click()
 
         # Wait for input; if it doesn't appear within 1s, the searchbar may be
         # in a different mode — that's acceptable for a rapid-interaction test.
         try:
             duo.wait_for_element(SEARCHBAR_INPUT, timeout=1)
-            search_input = duo.find_element(SEARCHBAR_INPUT)
-            search_input.send_keys("abc")
+            search_input = duo.driver.find_element(*LOC_SEARCH_INPUT)
+            fast_type(duo, "abc")
             search_input.send_keys(Keys.ESCAPE)
+            wait_for_focus_lost(duo, SEARCHBAR_INPUT, timeout=1)
         except Exception:
             # Input may not appear if searchbar is in a transitional mode
             pass
 
-        time.sleep(0.1)
-
-    # Final state should be stable
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Rapid interactions should not cause errors: {errors}"
-
 
 def test_searchbar_handles_multiple_open_close_cycles(prism_app_with_layouts):
     """
@@ -241,27 +216,21 @@ def test_searchbar_handles_multiple_open_close_cycles(prism_app_with_layouts):
     # Perform 5 open/close cycles
     for i in range(5):
         duo.wait_for_element(".prism-searchbar", timeout=3)
-        searchbar = duo.find_element(".prism-searchbar")
+        searchbar = duo.driver.find_element(*LOC_SEARCHBAR)
 
         # Open
         searchbar.click()
-        time.sleep(0.2)
 
         # Close via Escape if input is available
         try:
             duo.wait_for_element(SEARCHBAR_INPUT, timeout=1)
-            search_input = duo.find_element(SEARCHBAR_INPUT)
+            search_input = duo.driver.find_element(*LOC_SEARCH_INPUT)
             search_input.send_keys(Keys.ESCAPE)
+            wait_for_focus_lost(duo, SEARCHBAR_INPUT, timeout=1)
         except Exception:
             # Input may not appear in every cycle if mode transitions are fast
             pass
 
-        time.sleep(0.2)
-
-    # After all cycles, verify no errors accumulated
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Multiple cycles should not cause errors: {errors}"
-
 
 def test_searchbar_focus_management(prism_app_with_layouts):
     """
@@ -276,27 +245,23 @@ def test_searchbar_focus_management(prism_app_with_layouts):
 
     # Activate search mode
     duo.wait_for_element(".prism-searchbar", timeout=5)
-    searchbar = duo.find_element(".prism-searchbar")
+    searchbar = duo.driver.find_element(*LOC_SEARCHBAR)
     searchbar.click()
 
     # Wait for and click input
     duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    search_input = duo.find_element(SEARCHBAR_INPUT)
+    search_input = duo.driver.find_element(*LOC_SEARCH_INPUT)
     search_input.click()
 
     # Type to verify focus
-    search_input.send_keys("focused")
+    fast_type(duo, "focused")
 
     # Verify the value was accepted (proves focus worked)
     WebDriverWait(duo.driver, 2).until(
-        lambda d: "focused"
-        in (d.find_element(By.CSS_SELECTOR, SEARCHBAR_INPUT).get_attribute("value") or ""),
+        lambda d: "focused" in (d.find_element(*LOC_SEARCH_INPUT).get_attribute("value") or ""),
         message="Input should contain 'focused' after typing",
     )
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Focus management should not cause errors: {errors}"
-
 
 def test_searchbar_works_after_tab_operations(prism_app_with_layouts):
     """
@@ -311,37 +276,29 @@ def test_searchbar_works_after_tab_operations(prism_app_with_layouts):
     wait_for_tab_count(duo, 1)
 
     # Create 2 more tabs (3 total)
-    for _ in range(2):
-        add_button = duo.find_element(ADD_TAB_BUTTON)
-        add_button.click()
-
-    wait_for_tab_count(duo, 3)
+    seed_tabs(duo, 2)
 
     tabs = get_tabs(duo)
     assert len(tabs) == 3, "Should have 3 tabs"
 
-    # Click middle tab
+    # Click middle tab; tab bar and SearchBar must be back before interacting
     tabs[1].click()
-    duo.wait_for_element(".prism-searchbar", timeout=3)
+    wait_for_all_present(duo, [ADD_TAB_BUTTON, TAB_SELECTOR, ".prism-searchbar"])
 
     # Verify SearchBar can be activated
-    searchbar = duo.find_element(".prism-searchbar")
+    searchbar = duo.driver.find_element(*LOC_SEARCHBAR)
     searchbar.click()
 
     # Wait for search input and type into it
     duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    search_input = duo.find_element(SEARCHBAR_INPUT)
-    search_input.send_keys("test")
+    fast_type(duo, "test")
 
     # Verify input received the text
     WebDriverWait(duo.driver, 2).until(
-        lambda d: d.find_element(By.CSS_SELECTOR, SEARCHBAR_INPUT).get_attribute("value") == "test",
+        lambda d: d.find_element(*LOC_SEARCH_INPUT).get_attribute("value") == "test",
         message="Search input should contain 'test' after tab operations",
     )
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"SearchBar should work after tab operations: {errors}"
-
 
 def test_searchbar_survives_page_resize(prism_app_with_layouts):
     """
@@ -359,19 +316,14 @@ def test_searchbar_survives_page_resize(prism_app_with_layouts):
 
     # Activate SearchBar
     duo.wait_for_element(".prism-searchbar", timeout=5)
-    searchbar = duo.find_element(".prism-searchbar")
+    searchbar = duo.driver.find_element(*LOC_SEARCHBAR)
     searchbar.click()
 
     # Resize window
-    duo.driver.set_window_size(1200, 800)
-    time.sleep(0.5)
+    resize_window(duo, 1200, 800)
 
     # Resize back
-    duo.driver.set_window_size(initial_size["width"], initial_size["height"])
-    time.sleep(0.5)
+    resize_window(duo, initial_size["width"], initial_size["height"])
 
     # SearchBar should still be present and functional
     duo.wait_for_element(".prism-searchbar", timeout=3)
-
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Window resize should not cause errors: {errors}"
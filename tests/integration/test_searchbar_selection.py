@@ -14,18 +14,20 @@ Best Practices Applied:
 from __future__ import annotations
 
 import pytest
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 
 from conftest import (
-    TAB_SELECTOR,
-    SEARCHBAR_INPUT,
+    LAYOUT_ITEM_STATIC,
+    LAYOUT_ITEM_CALLBACK,
+    LOC_STATIC_ITEM,
+    LOC_CALLBACK_ITEM,
     wait_for_tab_count,
     get_tabs,
-    check_browser_errors,
+    open_search_and_type,
+    tab_text_contains,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def test_select_layout_from_search(prism_app_with_layouts):
@@ -34,97 +36,58 @@ def test_select_layout_from_search(prism_app_with_layouts):
     wait_for_tab_count(duo, 1)
 
     # Open SearchBar
-    duo.wait_for_element(".prism-searchbar", timeout=5)
-    duo.find_element(".prism-searchbar").click()
-    duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-
-    # Search for "Test Static Layout"
-    search_input = duo.find_element(SEARCHBAR_INPUT)
-    search_input.send_keys("Static")
-
-    # Wait for layout item to appear in dropdown
-    duo.wait_for_element("[data-testid='prism-layout-item-test-static']", timeout=5)
+    # Open SearchBar, search for "Test Static Layout" and wait for its item
+    open_search_and_type(duo, "Static", wait_for=LAYOUT_ITEM_STATIC)
 
     # Click the layout item
-    duo.find_element("[data-testid='prism-layout-item-test-static']").click()
+    duo.driver.find_element(*LOC_STATIC_ITEM).click()
 
     # Verify tab name updated to the layout name
-    def tab_shows_layout(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return any("Test Static Layout" in t.text for t in tabs)
-
     WebDriverWait(duo.driver, 10).until(
-        tab_shows_layout, message="Tab should show 'Test Static Layout' after selection"
+        tab_text_contains("Test Static Layout"),
+        message="Tab should show 'Test Static Layout' after selection",
     )
 
     # Verify the layout content was rendered
     duo.wait_for_element("[id*='static-content']", timeout=10)
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
-
 
 def test_select_layout_with_callback_content(prism_app_with_layouts):
     """Test selecting the callback layout renders the callback content."""
     duo = prism_app_with_layouts
     wait_for_tab_count(duo, 1)
 
-    # Open SearchBar
-    duo.wait_for_element(".prism-searchbar", timeout=5)
-    duo.find_element(".prism-searchbar").click()
-    duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-
-    # Search for "Callback"
-    search_input = duo.find_element(SEARCHBAR_INPUT)
-    search_input.send_keys("Callback")
-
-    # Wait for layout item to appear
-    duo.wait_for_element("[data-testid='prism-layout-item-test-callback']", timeout=5)
+    # Open SearchBar, search for "Callback" and wait for its item
+    open_search_and_type(duo, "Callback", wait_for=LAYOUT_ITEM_CALLBACK)
 
     # Click it
-    duo.find_element("[data-testid='prism-layout-item-test-callback']").click()
+    duo.driver.find_element(*LOC_CALLBACK_ITEM).click()
 
     # Verify tab name
-    def tab_shows_callback(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return any("Test Callback Layout" in t.text for t in tabs)
-
     WebDriverWait(duo.driver, 10).until(
-        tab_shows_callback, message="Tab should show 'Test Callback Layout'"
+        tab_text_contains("Test Callback Layout"), message="Tab should show 'Test Callback Layout'"
     )
 
     # Verify the callback layout content is rendered
     duo.wait_for_element("[id*='test-button']", timeout=10)
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
-
 
 def test_search_filters_layouts(prism_app_with_layouts):
     """Test that typing in search bar filters the layout list."""
     duo = prism_app_with_layouts
     wait_for_tab_count(duo, 1)
 
-    # Open SearchBar
-    duo.wait_for_element(".prism-searchbar", timeout=5)
-    duo.find_element(".prism-searchbar").click()
-    duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-
     # Type a query that matches only the static layout
-    search_input = duo.find_element(SEARCHBAR_INPUT)
-    search_input.send_keys("Static")
-
-    # The static layout item should appear
-    duo.wait_for_element("[data-testid='prism-layout-item-test-static']", timeout=5)
+    open_search_and_type(duo, "Static", wait_for=LAYOUT_ITEM_STATIC)
 
-    # The callback layout item should NOT appear (filtered out)
-    callback_items = duo.find_elements("[data-testid='prism-layout-item-test-callback']")
-    assert (
-        len(callback_items) == 0
-    ), "Callback layout should be filtered out when searching 'Static'"
-
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
+    counts = duo.driver.execute_script(
+        "return {static: document.querySelectorAll(arguments[0]).length,"
+        " callback: document.querySelectorAll(arguments[1]).length};",
+        LAYOUT_ITEM_STATIC,
+        LAYOUT_ITEM_CALLBACK,
+    )
+    assert counts["static"] == 1, "Static layout should match 'Static'"
+    assert counts["callback"] == 0, "Callback layout should be filtered out when searching 'Static'"
 
 
 def test_select_layout_opens_in_current_tab(prism_app_with_layouts):
@@ -137,12 +100,8 @@ def test_select_layout_opens_in_current_tab(prism_app_with_layouts):
     assert len(tabs) == 1, "Should start with 1 tab"
 
     # Select a layout
-    duo.wait_for_element(".prism-searchbar", timeout=5)
-    duo.find_element(".prism-searchbar").click()
-    duo.wait_for_element(SEARCHBAR_INPUT, timeout=3)
-    duo.find_element(SEARCHBAR_INPUT).send_keys("Static")
-    duo.wait_for_element("[data-testid='prism-layout-item-test-static']", timeout=5)
-    duo.find_element("[data-testid='prism-layout-item-test-static']").click()
+    open_search_and_type(duo, "Static", wait_for=LAYOUT_ITEM_STATIC)
+    duo.driver.find_element(*LOC_STATIC_ITEM).click()
 
     # Should still have 1 tab (layout opens in the current tab, not a new one)
     wait_for_tab_count(duo, 1)
@@ -150,11 +109,6 @@ def test_select_layout_opens_in_current_tab(prism_app_with_layouts):
     assert len(tabs) == 1, "Should still have 1 tab after selecting layout"
 
     # But the tab name should have changed
-    def tab_renamed(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return any("Test Static Layout" in t.text for t in tabs)
-
-    WebDriverWait(duo.driver, 10).until(tab_renamed, message="Tab should show layout name")
-
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
+    WebDriverWait(duo.driver, 10).until(
+        tab_text_contains("Test Static Layout"), message="Tab should show layout name"
+    )
@@ -18,12 +18,12 @@ from conftest import (
     wait_for_tab_count,
     wait_for_panel_count,
     wait_for_panel_layout_stable,
-    get_tabs,
-    get_panels,
-    check_browser_errors,
+    double_click,
+    count_tabs,
+    count_panels,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def test_split_button_visible_on_active_panel(prism_app_with_layouts):
@@ -33,17 +33,14 @@ def test_split_button_visible_on_active_panel(prism_app_with_layouts):
     buttons = duo.driver.find_elements(By.CSS_SELECTOR, SPLIT_PANEL_BUTTON)
     assert len(buttons) == 1, "Split button should be visible on the active panel"
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Browser console should have no errors: {errors}"
-
 
 def test_split_button_creates_new_panel(prism_app_with_layouts):
     """Clicking the split button should create a second panel with a new tab."""
     duo = prism_app_with_layouts
 
     # Start with 1 panel, 1 tab
-    assert len(get_panels(duo)) == 1
-    assert len(get_tabs(duo)) == 1
+    assert count_panels(duo) == 1
+    assert count_tabs(duo) == 1
 
     # Click split button
     split_btn = duo.find_element(SPLIT_PANEL_BUTTON)
@@ -54,11 +51,8 @@ def test_split_button_creates_new_panel(prism_app_with_layouts):
     wait_for_tab_count(duo, 2)
     wait_for_panel_layout_stable(duo)
 
-    assert len(get_panels(duo)) == 2, "Should have 2 panels after split"
-    assert len(get_tabs(duo)) == 2, "Should have 2 tabs after split"
-
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Browser console should have no errors: {errors}"
+    assert count_panels(duo) == 2, "Should have 2 panels after split"
+    assert count_tabs(duo) == 2, "Should have 2 tabs after split"
 
 
 def test_split_button_hidden_when_not_active(prism_app_with_layouts):
@@ -76,26 +70,17 @@ def test_split_button_hidden_when_not_active(prism_app_with_layouts):
     buttons = duo.driver.find_elements(By.CSS_SELECTOR, SPLIT_PANEL_BUTTON)
     assert len(buttons) == 1, "Only the active panel should show the split button"
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Browser console should have no errors: {errors}"
-
 
 def test_double_click_empty_space_still_works(prism_app_with_layouts):
     """Non-regression: double-clicking the empty tab bar space still adds a tab."""
     duo = prism_app_with_layouts
 
-    assert len(get_tabs(duo)) == 1
+    assert count_tabs(duo) == 1
 
     # Double-click the empty space area in the tab bar (inside the scrollable div)
     # The empty space div has title="Double-click to add new tab"
     empty_space = duo.driver.find_element(By.CSS_SELECTOR, "[title='Double-click to add new tab']")
-
-    from selenium.webdriver.common.action_chains import ActionChains
-
-    ActionChains(duo.driver).double_click(empty_space).perform()
+    double_click(duo, empty_space)
 
     wait_for_tab_count(duo, 2)
-    assert len(get_tabs(duo)) == 2, "Double-click on empty space should add a tab"
-
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Browser console should have no errors: {errors}"
+    assert count_tabs(duo) == 2, "Double-click on empty space should add a tab"
@@ -17,16 +17,17 @@ import pytest
 
 # Import helpers from conftest
 from conftest import (
-    TAB_SELECTOR,
     ADD_TAB_BUTTON,
+    TAB_BY_ID,
+    TAB_CLOSE_BUTTON,
     wait_for_tab_count,
     get_tabs,
-    get_tab_id,
-    check_browser_errors,
+    query_tabs,
+    seed_tabs,
 )
 
 # Mark all tests in this module as integration tests
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def test_create_new_tab(prism_app_with_layouts):
@@ -48,10 +49,6 @@ def test_create_new_tab(prism_app_with_layouts):
     tabs = get_tabs(duo)
     assert len(tabs) == 2, "Should have 2 tabs after clicking add"
 
-    # Best practice: check for browser errors
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Browser console should have no errors: {errors}"
-
 
 def test_close_tab(prism_app_with_layouts):
     """Test closing a tab via the close button."""
@@ -62,32 +59,34 @@ def test_close_tab(prism_app_with_layouts):
     add_button.click()
     wait_for_tab_count(duo, 2)
 
-    tabs = get_tabs(duo)
+    # Snapshot ids of all tabs in one round-trip
+    tabs = query_tabs(duo.driver)
     assert len(tabs) == 2, "Should have 2 tabs"
 
     # Get the second tab's ID
-    tab_id = get_tab_id(duo, 1)
-    assert tab_id is not None, "Tab ID should not be None"
-
-    # Hover over tab to reveal close button (it's hidden until hover)
-    tab = tabs[1]
-    duo.driver.execute_script(
-        "arguments[0].dispatchEvent(new MouseEvent('mouseenter', {bubbles: true}))", tab
+    tab_id = tabs[1]["id"]
+    assert tab_id, "Tab ID should not be empty"
+
+    # Hover and click the close button in one round-trip; the button is always
+    # rendered (only its opacity depends on hover), so no intermediate wait is needed.
+    closed = duo.driver.execute_script(
+        """
+        const [tabSelector, closeSelector] = arguments;
+        const tab = document.querySelector(tabSelector);
+        const btn = document.querySelector(closeSelector);
+        if (!tab || !btn) return false;
+        tab.dispatchEvent(new MouseEvent('mouseenter', {bubbles: true}));
+        btn.click();
+        return true;
+        """,
+        TAB_BY_ID.format(tab_id),
+        TAB_CLOSE_BUTTON.format(tab_id),
     )
+    assert closed, f"Close button for tab {tab_id} not found"
 
-    # Find and click the close button
-    close_selector = f"[data-testid='prism-tab-close-{tab_id}']"
-    duo.wait_for_element(close_selector, timeout=2)
-    close_button = duo.find_element(close_selector)
-    close_button.click()
-
-    # Wait for tab to be removed (explicit wait)
+    # Wait for tab to be removed (raises if the count never drops to 1)
     wait_for_tab_count(duo, 1)
 
-    # Verify tab was removed
-    tabs_after = get_tabs(duo)
-    assert len(tabs_after) == 1, "Should have 1 tab remaining after closing"
-
 
 def test_create_multiple_tabs(prism_app_with_layouts):
     """Test creating multiple tabs."""
@@ -112,13 +111,9 @@ def test_max_tabs_limit(prism_app_with_layouts):
     duo = prism_app_with_layouts
 
     # App is configured with maxTabs=10, start with 1 initial tab
-    # Create 9 more tabs (1 initial + 9 = 10 total)
-    for i in range(9):
-        # Re-fetch button each iteration to avoid stale element
-        add_button = duo.find_element(ADD_TAB_BUTTON)
-        # Use JavaScript click for reliability
-        duo.driver.execute_script("arguments[0].click();", add_button)
-        wait_for_tab_count(duo, i + 2)
+    # Create 9 more tabs (1 initial + 9 = 10 total) with in-page clicks and
+    # a single wait for the final count
+    seed_tabs(duo, 9)
 
     tabs = get_tabs(duo)
     assert len(tabs) == 10, "Should have 10 tabs (the max)"
@@ -167,9 +162,6 @@ def test_tab_persists_after_creation(prism_app_with_layouts):
 
     The fix ensures the store is stable and tabs persist.
     """
-    from selenium.webdriver.support.wait import WebDriverWait
-    from selenium.webdriver.common.by import By
-
     duo = prism_app_with_layouts
 
     # Start with 1 initial tab
@@ -185,12 +177,7 @@ def test_tab_persists_after_creation(prism_app_with_layouts):
 
     # Wait for Redux sync cycle to complete (500ms debounce + processing).
     # Poll for tab count stability rather than sleeping.
-    def tabs_still_at_2(driver):
-        return len(driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)) == 2
-
-    WebDriverWait(duo.driver, 3).until(
-        tabs_still_at_2, message="Tab should persist after Redux sync cycle"
-    )
+    wait_for_tab_count(duo, 2, timeout=3)
 
     # Add another tab to verify continued functionality
     add_button = duo.find_element(ADD_TAB_BUTTON)
@@ -198,13 +185,4 @@ def test_tab_persists_after_creation(prism_app_with_layouts):
     wait_for_tab_count(duo, 3)
 
     # Wait for sync cycle again
-    def tabs_still_at_3(driver):
-        return len(driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)) == 3
-
-    WebDriverWait(duo.driver, 3).until(
-        tabs_still_at_3, message="Both new tabs should persist after Redux sync cycle"
-    )
-
-    # Verify no browser errors occurred
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"Browser console should have no errors: {errors}"
+    wait_for_tab_count(duo, 3, timeout=3)
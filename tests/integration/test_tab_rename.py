@@ -15,26 +15,27 @@ from __future__ import annotations
 
 import pytest
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from conftest import (
-    TAB_SELECTOR,
     CONTEXT_MENU,
-    get_tabs,
+    TAB_BY_ID,
+    TAB_RENAME_INPUT,
     get_tab_id,
     wait_for_tab_count,
     wait_for_element_invisible,
-    check_browser_errors,
     open_context_menu,
     trigger_rename_mode,
     set_input_value_react,
     press_enter_on_element,
+    rename_committed,
+    query_tabs,
+    press_escape,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(f"browser-{__name__}")]
 
 
 def _click_context_menu_rename(duo, tab_id: str) -> str:
@@ -57,10 +58,10 @@ def _click_context_menu_rename(duo, tab_id: str) -> str:
     wait_for_element_invisible(duo, CONTEXT_MENU, timeout=3)
 
     # Wait for rename input to appear (React renders after state update)
-    rename_input_selector = f"[data-testid='prism-tab-rename-{tab_id}']"
+    rename_input_selector = TAB_RENAME_INPUT.format(tab_id)
     WebDriverWait(duo.driver, 5).until(
         EC.presence_of_element_located((By.CSS_SELECTOR, rename_input_selector)),
-        message=f"Rename input should appear after clicking Rename in context menu",
+        message="Rename input should appear after clicking Rename in context menu",
     )
     return rename_input_selector
 
@@ -74,7 +75,7 @@ def test_rename_via_context_menu(prism_app_with_layouts):
     assert tab_id is not None, "Tab ID should not be None"
 
     # Right-click tab to open context menu
-    tab = get_tabs(duo)[0]
+    tab = duo.find_element(TAB_BY_ID.format(tab_id))
     open_context_menu(duo, tab)
 
     # Click rename and wait for input
@@ -84,21 +85,12 @@ def test_rename_via_context_menu(prism_app_with_layouts):
     set_input_value_react(duo, rename_input_selector, "My Custom Tab")
     press_enter_on_element(duo, rename_input_selector)
 
-    # Wait for rename input to disappear (commit)
-    wait_for_element_invisible(duo, rename_input_selector, timeout=3)
-
-    # Verify tab text changed
-    def tab_has_new_name(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return any("My Custom Tab" in t.text for t in tabs)
-
+    # Wait for the commit: rename input gone and the tab shows the new name
     WebDriverWait(duo.driver, 5).until(
-        tab_has_new_name, message="Tab should be renamed to 'My Custom Tab'"
+        rename_committed(tab_id, "My Custom Tab"),
+        message="Tab should be renamed to 'My Custom Tab'",
     )
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
-
 
 def test_rename_via_double_click(prism_app_with_layouts):
     """Test renaming a tab by double-clicking it."""
@@ -108,16 +100,10 @@ def test_rename_via_double_click(prism_app_with_layouts):
     tab_id = get_tab_id(duo, 0)
     assert tab_id is not None, "Tab ID should not be None"
 
-    # Double-click the tab's inner trigger (button) to enter rename mode
+    # Double-click the tab's inner trigger (button); returns once the rename input mounts
     result = trigger_rename_mode(duo, tab_id)
-    assert result, "Should be able to trigger rename mode"
-
-    # Wait for rename input (allow time for React state + render cycle)
-    rename_input_selector = f"[data-testid='prism-tab-rename-{tab_id}']"
-    WebDriverWait(duo.driver, 5).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, rename_input_selector)),
-        message="Rename input should appear after double-click",
-    )
+    assert result, "Rename input should appear after double-click"
+    rename_input_selector = TAB_RENAME_INPUT.format(tab_id)
 
     # Set new name using React-compatible input setter
     set_input_value_react(duo, rename_input_selector, "Renamed Tab")
@@ -125,21 +111,11 @@ def test_rename_via_double_click(prism_app_with_layouts):
     # Press Enter to confirm
     press_enter_on_element(duo, rename_input_selector)
 
-    # Wait for rename input to disappear
-    wait_for_element_invisible(duo, rename_input_selector, timeout=3)
-
-    # Verify the tab shows the new name
-    def tab_has_new_name(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return any("Renamed Tab" in t.text for t in tabs)
-
+    # Wait for the commit: rename input gone and the tab shows the new name
     WebDriverWait(duo.driver, 5).until(
-        tab_has_new_name, message="Tab should be renamed to 'Renamed Tab'"
+        rename_committed(tab_id, "Renamed Tab"), message="Tab should be renamed to 'Renamed Tab'"
     )
 
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
-
 
 def test_rename_cancel_with_escape(prism_app_with_layouts):
     """Test that pressing Escape cancels a rename operation."""
@@ -149,11 +125,8 @@ def test_rename_cancel_with_escape(prism_app_with_layouts):
     tab_id = get_tab_id(duo, 0)
     assert tab_id is not None
 
-    # Get original tab name
-    original_name = get_tabs(duo)[0].text
-
     # Open context menu and click rename
-    tab = get_tabs(duo)[0]
+    tab = duo.find_element(TAB_BY_ID.format(tab_id))
     open_context_menu(duo, tab)
 
     # Click rename and wait for input
@@ -161,16 +134,14 @@ def test_rename_cancel_with_escape(prism_app_with_layouts):
 
     # Type a new name but press Escape to cancel
     set_input_value_react(duo, rename_input_selector, "This should not stick")
-    duo.find_element(rename_input_selector).send_keys(Keys.ESCAPE)
+    # set_input_value_react leaves the input focused, so a CDP key press reaches it
+    press_escape(duo)
 
     # Wait for rename input to disappear
     wait_for_element_invisible(duo, rename_input_selector, timeout=3)
 
     # Verify original name is preserved
-    tab_text = get_tabs(duo)[0].text
+    tab_text = query_tabs(duo.driver)[0]["text"]
     assert (
         "This should not stick" not in tab_text
     ), f"Escape should cancel rename, but tab text is '{tab_text}'"
-
-    errors = check_browser_errors(duo)
-    assert len(errors) == 0, f"No browser errors expected: {errors}"
@@ -5,17 +5,20 @@ This module contains helper functions for interacting with Prism components
 in integration tests. These utilities follow Dash testing best practices:
 - Use explicit waits (wait_for_*) instead of time.sleep()
 - Use reliable CSS selectors (data-testid)
-- Use ActionChains with .pause() for DnD operations
+- Sync DnD ActionChains phases on dnd-kit drag state instead of fixed pauses
 - Check for browser console errors
 """
 
 from __future__ import annotations
 
+import os
+
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
 
 # =============================================================================
 # CSS Selectors - use data-testid for stability across React re-renders
@@ -28,6 +31,11 @@ SEARCHBAR_INPUT = "[data-testid='prism-searchbar-input']"
 CONTEXT_MENU = "[data-testid='prism-context-menu']"
 PRISM_ROOT = ".prism-root"
 
+# Per-tab selector templates - format once per test with the tab id
+TAB_BY_ID = "[data-testid='prism-tab-{}']"
+TAB_CLOSE_BUTTON = "[data-testid='prism-tab-close-{}']"
+TAB_RENAME_INPUT = "[data-testid='prism-tab-rename-{}']"
+
 # DnD Drop Zone Selectors
 # Note: Actual DOM uses data-testid="prism-drop-zone-{edge}-{panelId}"
 # so we use ^= (starts-with) prefix matching
@@ -36,6 +44,28 @@ DROP_ZONE_RIGHT = "[data-testid^='prism-drop-zone-right']"
 DROP_ZONE_TOP = "[data-testid^='prism-drop-zone-top']"
 DROP_ZONE_BOTTOM = "[data-testid^='prism-drop-zone-bottom']"
 
+# dnd-kit marks the tab being dragged with aria-pressed while a drag is active
+DRAGGING_TAB = "[data-testid^='prism-tab-'][aria-pressed='true']"
+
+# SearchBar items for the layouts registered by the prism_app_with_layouts fixture
+LAYOUT_ITEM_STATIC = "[data-testid='prism-layout-item-test-static']"
+LAYOUT_ITEM_CALLBACK = "[data-testid='prism-layout-item-test-callback']"
+
+# Set PRISM_STRICT_USER_GESTURES=1 to drive gestures through real WebDriver input
+# instead of synthetic JS events (slower, but exercises the browser's input pipeline).
+STRICT_USER_GESTURES = os.environ.get("PRISM_STRICT_USER_GESTURES") == "1"
+
+# Locator tuples for direct ``driver.find_element(*LOC_...)`` calls
+LOC_SEARCHBAR = (By.CSS_SELECTOR, ".prism-searchbar")
+LOC_SEARCH_INPUT = (By.CSS_SELECTOR, SEARCHBAR_INPUT)
+LOC_STATIC_ITEM = (By.CSS_SELECTOR, LAYOUT_ITEM_STATIC)
+LOC_CALLBACK_ITEM = (By.CSS_SELECTOR, LAYOUT_ITEM_CALLBACK)
+
+
+def action_selector(action_id: str) -> str:
+    """Return the CSS selector for the status bar button of an Action."""
+    return f"[data-testid='prism-action-{action_id}']"
+
 
 # =============================================================================
 # Layout Stabilization Helpers
@@ -79,15 +109,93 @@ def wait_for_panel_layout_stable(dash_duo, timeout: float = 5.0) -> bool:
         return False
 
 
+def resize_window(dash_duo, width: int, height: int, timeout: float = 2.0) -> bool:
+    """
+    Resize the browser window and wait for the page's ``resize`` event.
+
+    Replaces a fixed sleep after ``set_window_size``: a one-shot listener
+    records the event and the wait ends as soon as it has fired.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    width : int
+        New window width in pixels.
+    height : int
+        New window height in pixels.
+    timeout : float
+        Maximum wait time in seconds.
+
+    Returns
+    -------
+    bool
+        True if the resize event fired within timeout.
+    """
+    dash_duo.driver.execute_script(
+        "window.__prismResized = false;"
+        "window.addEventListener('resize', () => { window.__prismResized = true; }, {once: true});"
+    )
+    dash_duo.driver.set_window_size(width, height)
+    WebDriverWait(dash_duo.driver, timeout, poll_frequency=0.02).until(
+        lambda d: d.execute_script("return window.__prismResized === true"),
+        message=f"Window did not fire a resize event after resizing to {width}x{height}",
+    )
+    return True
+
+
 # =============================================================================
 # Wait Helpers - explicit waits per Dash testing best practices
 # Default timeout is 10s for reliability in headless Chrome.
 # =============================================================================
+def _wait_for_selector_count(
+    dash_duo, selector: str, expected_count: int, timeout: float, message: str
+) -> bool:
+    """
+    Wait until ``selector`` matches exactly ``expected_count`` elements.
+
+    A MutationObserver re-counts on every DOM change and resolves the async
+    script the moment the count matches, so there is no polling interval.
+    ``timeout`` must stay below the driver's script timeout (30s default).
+    """
+    matched = dash_duo.driver.execute_async_script(
+        """
+        const [selector, expected, timeoutMs, done] = arguments;
+        const matches = () => document.querySelectorAll(selector).length === expected;
+        if (matches()) return done(true);
+        const observer = new MutationObserver(() => {
+            if (matches()) {
+                observer.disconnect();
+                clearTimeout(timer);
+                done(true);
+            }
+        });
+        const timer = setTimeout(() => {
+            observer.disconnect();
+            done(matches());
+        }, timeoutMs);
+        observer.observe(document.body, {
+            childList: true,
+            subtree: true,
+            attributes: true,
+            attributeFilter: ['data-testid'],
+        });
+        """,
+        selector,
+        expected_count,
+        int(timeout * 1000),
+    )
+    if not matched:
+        raise TimeoutException(message)
+    return True
+
+
 def wait_for_tab_count(dash_duo, expected_count: int, timeout: float = 10.0) -> bool:
     """
     Wait until the number of tabs equals expected_count.
 
-    Uses explicit WebDriverWait instead of time.sleep() for reliability.
+    Resolves as soon as the DOM changes to the expected count (MutationObserver)
+    instead of polling every 500ms.
 
     Parameters
     ----------
@@ -108,15 +216,13 @@ def wait_for_tab_count(dash_duo, expected_count: int, timeout: float = 10.0) ->
     TimeoutException
         If condition not met within timeout.
     """
-
-    def tab_count_equals(driver):
-        tabs = driver.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-        return len(tabs) == expected_count
-
-    WebDriverWait(dash_duo.driver, timeout).until(
-        tab_count_equals, message=f"Expected {expected_count} tabs but condition not met"
+    return _wait_for_selector_count(
+        dash_duo,
+        TAB_SELECTOR,
+        expected_count,
+        timeout,
+        message=f"Expected {expected_count} tabs but condition not met",
     )
-    return True
 
 
 def wait_for_panel_count(dash_duo, expected_count: int, timeout: float = 10.0) -> bool:
@@ -137,13 +243,106 @@ def wait_for_panel_count(dash_duo, expected_count: int, timeout: float = 10.0) -
     bool
         True if condition met within timeout.
     """
+    return _wait_for_selector_count(
+        dash_duo,
+        PANEL_SELECTOR,
+        expected_count,
+        timeout,
+        message=f"Expected {expected_count} panels but condition not met",
+    )
 
-    def panel_count_equals(driver):
-        panels = driver.find_elements(By.CSS_SELECTOR, PANEL_SELECTOR)
-        return len(panels) == expected_count
 
-    WebDriverWait(dash_duo.driver, timeout).until(
-        panel_count_equals, message=f"Expected {expected_count} panels but condition not met"
+def wait_for_all_present(dash_duo, selectors, timeout: float = 3.0) -> bool:
+    """
+    Wait until every selector matches at least one element.
+
+    All selectors are checked in a single ``execute_script`` per poll instead
+    of one ``wait_for_element`` round-trip each.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    selectors : Iterable[str]
+        CSS selectors that must all be present.
+    timeout : float
+        Maximum wait time in seconds (default 3s).
+
+    Returns
+    -------
+    bool
+        True if all selectors matched within timeout.
+    """
+    selectors = list(selectors)
+    WebDriverWait(dash_duo.driver, timeout, poll_frequency=0.05).until(
+        lambda d: d.execute_script(
+            "return arguments[0].every(s => document.querySelector(s) !== null)", selectors
+        ),
+        message=f"Not all elements present: {selectors}",
+    )
+    return True
+
+
+def wait_for_focus_lost(dash_duo, selector: str, timeout: float = 2.0) -> bool:
+    """
+    Wait until the element matching ``selector`` no longer has focus.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    selector : str
+        CSS selector of the element expected to blur.
+    timeout : float
+        Maximum wait time in seconds (default 2s).
+
+    Returns
+    -------
+    bool
+        True if focus left the element within timeout.
+    """
+    WebDriverWait(dash_duo.driver, timeout, poll_frequency=0.05).until(
+        lambda d: d.execute_script(
+            "const el = document.activeElement; return !el || !el.matches(arguments[0]);",
+            selector,
+        ),
+        message=f"Element {selector} still has focus",
+    )
+    return True
+
+
+def wait_for_text(dash_duo, selector: str, text: str, timeout: float = 5.0) -> bool:
+    """
+    Wait until the element matching ``selector`` has exactly ``text``.
+
+    Like ``dash_duo.wait_for_text_to_equal`` but reads the text in one
+    in-page script every 50ms, instead of ``find_element`` + ``.text`` +
+    ``get_attribute`` every 500ms.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    selector : str
+        CSS selector of the element.
+    text : str
+        Expected rendered text.
+    timeout : float
+        Maximum wait time in seconds (default 5s).
+
+    Returns
+    -------
+    bool
+        True if the text matched within timeout.
+    """
+    WebDriverWait(dash_duo.driver, timeout, poll_frequency=0.05).until(
+        lambda d: d.execute_script(
+            "const el = document.querySelector(arguments[0]);"
+            "return !!el && el.innerText === arguments[1];",
+            selector,
+            text,
+        ),
+        message=f"Text '{text}' not found in {selector}",
     )
     return True
 
@@ -209,11 +408,132 @@ def get_tabs(dash_duo):
     return dash_duo.find_elements(TAB_SELECTOR)
 
 
+def query_tabs(driver, root_selector: str | None = None) -> list[dict]:
+    """
+    Read id and text of every tab in a single ``execute_script`` round-trip.
+
+    Prefer this over ``get_tabs`` + per-element ``.text``/``get_attribute``
+    inside polling predicates, where each element read is its own WebDriver
+    command.
+
+    Parameters
+    ----------
+    driver : WebDriver
+        The Selenium driver (``dash_duo.driver`` or a WebDriverWait argument).
+    root_selector : str | None
+        Optional selector to scope the query (e.g. a single panel).
+
+    Returns
+    -------
+    list[dict]
+        One ``{"id": str, "text": str}`` entry per tab, in DOM order.
+    """
+    return driver.execute_script(
+        """
+        const root = arguments[1] ? document.querySelector(arguments[1]) : document;
+        if (!root) return [];
+        return Array.from(root.querySelectorAll(arguments[0]), (el) => ({
+            id: (el.getAttribute('data-testid') || '').replace('prism-tab-', ''),
+            text: el.innerText,
+        }));
+        """,
+        TAB_SELECTOR,
+        root_selector,
+    )
+
+
+def tab_text_contains(text: str):
+    """
+    Return a WebDriverWait predicate: some tab's text contains ``text``.
+
+    The check runs in the page, so each poll is a single round trip instead
+    of one ``find_elements`` plus one ``.text`` call per tab.
+
+    Parameters
+    ----------
+    text : str
+        Substring to look for in the tab labels.
+
+    Returns
+    -------
+    callable
+        Predicate accepting a WebDriver, for use with ``WebDriverWait.until``.
+    """
+    script = (
+        "return [...document.querySelectorAll(arguments[0])]"
+        ".some(t => t.innerText.includes(arguments[1]));"
+    )
+    return lambda driver: driver.execute_script(script, TAB_SELECTOR, text)
+
+
+def rename_committed(tab_id: str, text: str):
+    """
+    Return a WebDriverWait predicate: the rename input is gone and the tab shows ``text``.
+
+    Both halves of the rename commit are checked in one script per poll, so
+    the wait ends as soon as the combined invariant holds.
+
+    Parameters
+    ----------
+    tab_id : str
+        The tab being renamed.
+    text : str
+        Substring expected in some tab label after the commit.
+
+    Returns
+    -------
+    callable
+        Predicate accepting a WebDriver, for use with ``WebDriverWait.until``.
+    """
+    script = """
+        const input = document.querySelector(arguments[0]);
+        if (input && input.getClientRects().length) return false;
+        return [...document.querySelectorAll(arguments[1])]
+            .some(t => t.innerText.includes(arguments[2]));
+    """
+    input_selector = TAB_RENAME_INPUT.format(tab_id)
+    return lambda driver: driver.execute_script(script, input_selector, TAB_SELECTOR, text)
+
+
 def get_panels(dash_duo):
     """Return list of panel elements."""
     return dash_duo.find_elements(PANEL_SELECTOR)
 
 
+def count_tabs(dash_duo) -> int:
+    """Return the number of tabs, counted in-page without fetching WebElements."""
+    return dash_duo.driver.execute_script(
+        "return document.querySelectorAll(arguments[0]).length", TAB_SELECTOR
+    )
+
+
+def count_panels(dash_duo) -> int:
+    """Return the number of panels, counted in-page without fetching WebElements."""
+    return dash_duo.driver.execute_script(
+        "return document.querySelectorAll(arguments[0]).length", PANEL_SELECTOR
+    )
+
+
+def _id_from_testid(dash_duo, selector: str, index: int, prefix: str) -> str | None:
+    """
+    Return the ``data-testid`` of the ``index``-th ``selector`` match minus ``prefix``.
+
+    Reads only the one attribute in a single ``execute_script``; returns
+    None if there is no such element or its test id lacks the prefix.
+    """
+    testid = dash_duo.driver.execute_script(
+        """
+        const el = document.querySelectorAll(arguments[0])[arguments[1]];
+        return el ? el.getAttribute('data-testid') : null;
+        """,
+        selector,
+        index,
+    )
+    if testid and testid.startswith(prefix) and len(testid) > len(prefix):
+        return testid[len(prefix) :]
+    return None
+
+
 def get_tab_id(dash_duo, index: int = 0) -> str | None:
     """
     Get the ID of a tab by index.
@@ -230,11 +550,7 @@ def get_tab_id(dash_duo, index: int = 0) -> str | None:
     str | None
         The tab ID or None if not found.
     """
-    tabs = get_tabs(dash_duo)
-    if index < len(tabs):
-        testid = tabs[index].get_attribute("data-testid")
-        return testid.replace("prism-tab-", "") if testid else None
-    return None
+    return _id_from_testid(dash_duo, TAB_SELECTOR, index, "prism-tab-")
 
 
 def get_panel_id(dash_duo, panel_index: int = 0) -> str | None:
@@ -253,18 +569,15 @@ def get_panel_id(dash_duo, panel_index: int = 0) -> str | None:
     str | None
         Panel ID or None if not found.
     """
-    panels = get_panels(dash_duo)
-    if panel_index >= len(panels):
-        return None
-
-    testid = panels[panel_index].get_attribute("data-testid")
-    return testid.replace("prism-panel-", "") if testid else None
+    return _id_from_testid(dash_duo, PANEL_SELECTOR, panel_index, "prism-panel-")
 
 
 def get_tab_order_in_panel(dash_duo, panel_index: int = 0) -> list[str]:
     """
     Get the order of tab IDs in a specific panel.
 
+    The panel lookup and the tab query run in one ``execute_script``.
+
     Parameters
     ----------
     dash_duo : DashComposite
@@ -277,20 +590,18 @@ def get_tab_order_in_panel(dash_duo, panel_index: int = 0) -> list[str]:
     list[str]
         List of tab IDs in order.
     """
-    panels = get_panels(dash_duo)
-    if panel_index >= len(panels):
-        return []
-
-    panel = panels[panel_index]
-    tabs = panel.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-
-    tab_ids = []
-    for tab in tabs:
-        testid = tab.get_attribute("data-testid")
-        if testid:
-            tab_ids.append(testid.replace("prism-tab-", ""))
-
-    return tab_ids
+    return dash_duo.driver.execute_script(
+        """
+        const panel = document.querySelectorAll(arguments[0])[arguments[1]];
+        if (!panel) return [];
+        return Array.from(panel.querySelectorAll(arguments[2]), (el) =>
+            (el.getAttribute('data-testid') || '').replace('prism-tab-', '')
+        ).filter(Boolean);
+        """,
+        PANEL_SELECTOR,
+        panel_index,
+        TAB_SELECTOR,
+    )
 
 
 def verify_tab_in_panel(dash_duo, tab_id: str, panel_index: int = 0) -> bool:
@@ -338,6 +649,9 @@ def check_browser_errors(dash_duo) -> list:
     Check browser console for errors.
 
     Per Dash testing best practices, always check for console errors.
+    dash[testing] configures Chrome (``goog:loggingPrefs``) to forward only
+    SEVERE entries; the level is still checked here in case a custom browser
+    setup forwards more.
 
     Parameters
     ----------
@@ -349,20 +663,39 @@ def check_browser_errors(dash_duo) -> list:
     list
         List of error log entries (should be empty for passing tests).
     """
-    logs = dash_duo.get_logs()
-    # Filter for severe errors only
-    errors = [log for log in logs if log.get("level") == "SEVERE"]
-    return errors
+    return [entry for entry in dash_duo.get_logs() or [] if entry.get("level") == "SEVERE"]
+
+
+def first_browser_error(dash_duo):
+    """
+    Return the first browser console error, or None if there is none.
+
+    Use as ``assert first_browser_error(dash_duo) is None``; the failure
+    message then shows the offending entry directly.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+
+    Returns
+    -------
+    dict | None
+        The first SEVERE log entry, or None for a clean console.
+    """
+    return next(iter(check_browser_errors(dash_duo)), None)
 
 
 # =============================================================================
 # React Interaction Helpers
 # =============================================================================
-def trigger_rename_mode(dash_duo, tab_id: str) -> bool:
+def trigger_rename_mode(dash_duo, tab_id: str, timeout: float = 5.0) -> bool:
     """
     Trigger rename mode on a tab using JavaScript dblclick.
 
-    This handles React's async state updates by using execute_async_script.
+    A synthetic ``dblclick`` avoids ActionChains' two-click timing race with
+    React's onDoubleClick. The async script resolves as soon as the rename
+    input mounts (MutationObserver) instead of after a fixed delay.
 
     Parameters
     ----------
@@ -370,16 +703,20 @@ def trigger_rename_mode(dash_duo, tab_id: str) -> bool:
         The dash testing fixture.
     tab_id : str
         The tab ID to rename.
+    timeout : float
+        Maximum time to wait for the rename input, in seconds.
 
     Returns
     -------
     bool
-        True if rename mode was triggered successfully.
+        True if the rename input appeared.
     """
     result = dash_duo.driver.execute_async_script(
         """
         var callback = arguments[arguments.length - 1];
         var tabId = arguments[0];
+        var inputSelector = arguments[1];
+        var timeoutMs = arguments[2];
         var tabWrapper = document.querySelector("[data-testid='prism-tab-" + tabId + "']");
         if (!tabWrapper) { callback(false); return; }
 
@@ -389,15 +726,28 @@ def trigger_rename_mode(dash_duo, tab_id: str) -> bool:
         var trigger = tabWrapper.querySelector("[role='tab']");
         if (!trigger) { callback(false); return; }
 
+        // Resolve once React has rendered the rename input
+        var observer = new MutationObserver(function() {
+            if (document.querySelector(inputSelector)) {
+                observer.disconnect();
+                clearTimeout(timer);
+                callback(true);
+            }
+        });
+        var timer = setTimeout(function() {
+            observer.disconnect();
+            callback(!!document.querySelector(inputSelector));
+        }, timeoutMs);
+        observer.observe(document.body, { childList: true, subtree: true });
+
         var evt = new MouseEvent('dblclick', {
             bubbles: true, cancelable: true, view: window, detail: 2
         });
         trigger.dispatchEvent(evt);
-
-        // Wait for React to process the state update
-        setTimeout(function() { callback(true); }, 150);
     """,
         tab_id,
+        TAB_RENAME_INPUT.format(tab_id),
+        int(timeout * 1000),
     )
     return result
 
@@ -407,6 +757,9 @@ def set_input_value_react(dash_duo, selector: str, value: str):
     Set input value in a way that works with React's controlled inputs.
 
     React uses custom value descriptors, so we need to use the native setter.
+    React flushes discrete ``input`` events synchronously, so the script reads
+    back the committed value and the helper only polls if React has not yet
+    accepted it.
 
     Parameters
     ----------
@@ -417,12 +770,12 @@ def set_input_value_react(dash_duo, selector: str, value: str):
     value : str
         Value to set.
     """
-    dash_duo.driver.execute_script(
+    current = dash_duo.driver.execute_script(
         """
         var input = document.querySelector(arguments[0]);
         if (input) {
-            // Focus the input first
-            input.focus();
+            // Focus the input first (rename inputs are usually auto-focused)
+            if (document.activeElement !== input) input.focus();
 
             // Use the native setter to bypass React's descriptor
             var nativeInputValueSetter = Object.getOwnPropertyDescriptor(
@@ -430,22 +783,143 @@ def set_input_value_react(dash_duo, selector: str, value: str):
             ).set;
             nativeInputValueSetter.call(input, arguments[1]);
 
-            // Trigger React's onChange - need both 'input' and 'change' events
-            input.dispatchEvent(new Event('input', { bubbles: true }));
-            input.dispatchEvent(new Event('change', { bubbles: true }));
+            // React's onChange listens for the bubbled 'input' event
+            input.dispatchEvent(new InputEvent('input', {
+                bubbles: true, data: arguments[1], inputType: 'insertReplacementText'
+            }));
+            return input.value;
         }
+        return null;
         """,
         selector,
         value,
     )
+    if current == value:
+        return
 
-    # explicit wait for the value to be set, replacing the hardcoded JS timeout
-    WebDriverWait(dash_duo.driver, 2.0).until(
-        lambda d: d.find_element(By.CSS_SELECTOR, selector).get_attribute("value") == value,
+    WebDriverWait(dash_duo.driver, 2.0, poll_frequency=0.05).until(
+        lambda d: d.execute_script(
+            "const el = document.querySelector(arguments[0]); return el && el.value;", selector
+        )
+        == value,
         message=f"Value '{value}' was not set on element '{selector}'",
     )
 
 
+def fast_type(dash_duo, text: str) -> None:
+    """
+    Type text into the focused element with one CDP ``Input.insertText`` call.
+
+    The whole string is inserted as a single input event (like a paste), so
+    React's onChange fires once. Keep ``send_keys`` where per-key events are
+    under test.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    text : str
+        Text to insert at the current caret position.
+    """
+    dash_duo.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+
+
+def cdp_type(dash_duo, selector: str, text: str) -> None:
+    """
+    Focus ``selector`` and type ``text`` with a single CDP insert.
+
+    Falls back to ``send_keys`` on drivers without CDP support (non-Chromium).
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    selector : str
+        CSS selector for the input element.
+    text : str
+        Text to type.
+    """
+    driver = dash_duo.driver
+    if not hasattr(driver, "execute_cdp_cmd"):
+        dash_duo.find_element(selector).send_keys(text)
+        return
+    driver.execute_script("document.querySelector(arguments[0]).focus();", selector)
+    fast_type(dash_duo, text)
+
+
+def open_search_and_type(
+    dash_duo, query: str, wait_for: str | None = None, timeout: float = 5.0
+) -> bool:
+    """
+    Open the SearchBar and type ``query`` in a single async script.
+
+    Clicks ``.prism-searchbar``, waits for the search input to mount, sets its
+    value through the native setter (so React's onChange fires) and, if
+    ``wait_for`` is given, resolves once that selector is present after the
+    next render.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    query : str
+        Text to enter in the search input.
+    wait_for : str, optional
+        CSS selector that must appear after typing (e.g. a layout item).
+    timeout : float
+        Maximum wait time in seconds.
+
+    Returns
+    -------
+    bool
+        True once the query is entered (and ``wait_for`` is present).
+
+    Raises
+    ------
+    TimeoutException
+        If the input or ``wait_for`` selector does not appear in time.
+    """
+    result = dash_duo.driver.execute_async_script(
+        """
+        const [bar, inputSel, query, waitFor, timeoutMs, done] = arguments;
+        const deadline = Date.now() + timeoutMs;
+        const setter = Object.getOwnPropertyDescriptor(
+            window.HTMLInputElement.prototype, 'value'
+        ).set;
+        let typed = false;
+        const step = () => {
+            if (!typed) {
+                const input = document.querySelector(inputSel);
+                if (input) {
+                    input.focus();
+                    setter.call(input, query);
+                    input.dispatchEvent(new Event('input', {bubbles: true}));
+                    typed = true;
+                }
+            } else if (!waitFor || document.querySelector(waitFor)) {
+                return done('ok');
+            }
+            if (Date.now() > deadline) return done(typed ? 'missing' : 'no-input');
+            requestAnimationFrame(step);
+        };
+        const el = document.querySelector(bar);
+        if (!el) return done('no-searchbar');
+        el.click();
+        requestAnimationFrame(step);
+        """,
+        ".prism-searchbar",
+        SEARCHBAR_INPUT,
+        query,
+        wait_for,
+        int(timeout * 1000),
+    )
+    if result != "ok":
+        raise TimeoutException(
+            f"open_search_and_type({query!r}) failed: {result} (wait_for={wait_for!r})"
+        )
+    return True
+
+
 def press_enter_on_element(dash_duo, selector: str):
     """
     Press Enter key on an element to trigger onKeyDown handler.
@@ -477,10 +951,50 @@ def press_enter_on_element(dash_duo, selector: str):
 # =============================================================================
 # Tab Management Helpers
 # =============================================================================
+def seed_tabs(dash_duo, count: int) -> int:
+    """
+    Add ``count`` tabs to the active panel in a single WebDriver round-trip.
+
+    Clicks the add-tab button in-page ``count`` times from one
+    ``execute_script`` call, then waits once for the final tab count. Use it
+    when a test only needs tabs to exist; keep real clicks where tab creation
+    itself is under test.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    count : int
+        Number of tabs to add.
+
+    Returns
+    -------
+    int
+        Total number of tabs after seeding.
+    """
+    initial = dash_duo.driver.execute_script(
+        """
+        const before = document.querySelectorAll(arguments[0]).length;
+        for (let i = 0; i < arguments[2]; i++) {
+            document.querySelector(arguments[1]).click();
+        }
+        return before;
+        """,
+        TAB_SELECTOR,
+        ADD_TAB_BUTTON,
+        count,
+    )
+    wait_for_tab_count(dash_duo, initial + count)
+    return initial + count
+
+
 def create_tabs_for_dnd_test(dash_duo, count: int = 3) -> list[str]:
     """
     Create multiple tabs for DnD testing.
 
+    The tabs are added with ``seed_tabs`` and their IDs read with one
+    ``query_tabs`` call, instead of a click, count wait and ID read per tab.
+
     Parameters
     ----------
     dash_duo : DashComposite
@@ -493,23 +1007,151 @@ def create_tabs_for_dnd_test(dash_duo, count: int = 3) -> list[str]:
     list[str]
         List of tab IDs in order.
     """
-    initial_tab_id = get_tab_id(dash_duo, 0)
-    tab_ids = [initial_tab_id] if initial_tab_id else []
-
-    add_button = dash_duo.find_element(ADD_TAB_BUTTON)
-    for _ in range(count - 1):
-        add_button.click()
-        wait_for_tab_count(dash_duo, len(tab_ids) + 1)
-        new_tab_id = get_tab_id(dash_duo, len(tab_ids))
-        if new_tab_id:
-            tab_ids.append(new_tab_id)
-
-    return tab_ids
+    if count > 1:
+        seed_tabs(dash_duo, count - 1)
+    return [tab["id"] for tab in query_tabs(dash_duo.driver) if tab["id"]]
 
 
 # =============================================================================
 # Drag-and-Drop Helpers - for @dnd-kit testing with ActionChains
 # =============================================================================
+def _wait_for_drag_state(dash_duo, active: bool, timeout: float = 2.0) -> bool:
+    """
+    Wait until a tab drag is (or is no longer) active.
+
+    dnd-kit sets ``aria-pressed`` on the dragged tab once its sensor has
+    activated, so the drag helpers sync on that instead of fixed pauses.
+    Returns False on timeout so callers can still release the pointer.
+    """
+    try:
+        WebDriverWait(dash_duo.driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script(
+                "return document.querySelector(arguments[0]) !== null", DRAGGING_TAB
+            )
+            == active
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def _resolve_drag_targets(
+    driver,
+    source_panel_idx: int,
+    source_tab_idx: int,
+    target_panel_idx: int,
+    target_tab_idx: int | None = None,
+) -> dict | None:
+    """
+    Look up the elements a drag helper needs in a single script round-trip.
+
+    Returns a dict with ``sourceTab``, ``targetTab``, ``targetPanel`` (as
+    WebElements), ``targetPanelId`` and ``sourceRect``/``targetPanelRect``
+    (viewport rects), or None if either panel or the source tab index is out
+    of range.
+    ``targetTab`` is None when ``target_tab_idx`` is None or out of range.
+    """
+    return driver.execute_script(
+        """
+        const [panelSel, tabSel, sp, st, tp, tt] = arguments;
+        const panels = document.querySelectorAll(panelSel);
+        const sourcePanel = panels[sp];
+        const targetPanel = panels[tp];
+        if (!sourcePanel || !targetPanel) return null;
+        const sourceTab = sourcePanel.querySelectorAll(tabSel)[st];
+        if (!sourceTab) return null;
+        const targetTab = tt === null ? null : targetPanel.querySelectorAll(tabSel)[tt] || null;
+        const rect = (el) => {
+            const r = el.getBoundingClientRect();
+            return {x: r.x, y: r.y, width: r.width, height: r.height};
+        };
+        return {
+            sourceTab, targetTab, targetPanel,
+            targetPanelId: targetPanel.dataset.testid.slice("prism-panel-".length),
+            sourceRect: rect(sourceTab), targetPanelRect: rect(targetPanel),
+        };
+        """,
+        PANEL_SELECTOR,
+        TAB_SELECTOR,
+        source_panel_idx,
+        source_tab_idx,
+        target_panel_idx,
+        target_tab_idx,
+    )
+
+
+def _js_drag(dash_duo, source_element, target_element, offset_x: int = 0, offset_y: int = 0) -> str:
+    """
+    Drag with synthetic PointerEvents dispatched in one async script.
+
+    Mirrors the ActionChains sequence (pointerdown, three 5px nudges past the
+    8px activation distance, move to the target centre plus offset, pointerup)
+    but waits for animation frames in the page instead of WebDriver round-trips,
+    so React can commit dnd-kit's ``active``/``over`` state between steps.
+    If the drag never activates, or the script fails after the pointerdown,
+    a ``pointercancel`` is sent instead of the pointerup so the sensor is not
+    left mid-drag and nothing is dropped.
+
+    Returns
+    -------
+    str
+        ``"dropped"`` if the drag activated and was released on the target,
+        ``"cancelled"`` if a pointerdown was dispatched but the drag was
+        cancelled, or ``"not-dispatched"`` if no pointer event reached the
+        page; only the last one is safe to retry with real WebDriver input.
+    """
+    return dash_duo.driver.execute_async_script(
+        """
+        const [src, tgt, dx, dy, draggingSel, done] = arguments;
+        let down = null;
+        const frames = (n) => new Promise((resolve) => {
+            const step = () => (--n <= 0 ? resolve() : requestAnimationFrame(step));
+            requestAnimationFrame(step);
+        });
+        const center = (el) => {
+            const r = el.getBoundingClientRect();
+            return [r.x + r.width / 2, r.y + r.height / 2];
+        };
+        const fire = (el, type, [x, y]) => el.dispatchEvent(new PointerEvent(type, {
+            bubbles: true, cancelable: true, composed: true, view: window,
+            pointerId: 1, pointerType: 'mouse', isPrimary: true,
+            button: 0, buttons: ['pointerup', 'pointercancel'].includes(type) ? 0 : 1,
+            clientX: x, clientY: y,
+        }));
+        const cancel = async (point) => {
+            fire(document, 'pointercancel', point);
+            await frames(2);
+            done('cancelled');
+        };
+        (async () => {
+            src.scrollIntoView({block: 'center', inline: 'center'});
+            const [sx, sy] = center(src);
+            down = [sx, sy];
+            fire(src, 'pointerdown', down);
+            for (const i of [1, 2, 3]) fire(document, 'pointermove', [sx + 5 * i, sy]);
+            let activated = false;
+            for (let i = 0; i < 30 && !activated; i++) {
+                await frames(1);
+                activated = document.querySelector(draggingSel) !== null;
+            }
+            if (!activated) return cancel(down);
+            // Measure the target after activation: drop zones and overlays shift layout
+            const [tx, ty] = center(tgt);
+            fire(document, 'pointermove', [tx + dx, ty + dy]);
+            await frames(2);
+            fire(document, 'pointerup', [tx + dx, ty + dy]);
+            await frames(2);
+            done('dropped');
+        })().catch(() => (down === null ? done('not-dispatched') : cancel(down)));
+        """,
+        source_element,
+        target_element,
+        offset_x,
+        offset_y,
+        DRAGGING_TAB,
+    )
+
+
 def perform_drag_and_drop(
     dash_duo,
     source_element,
@@ -517,18 +1159,19 @@ def perform_drag_and_drop(
     offset_x: int = 0,
     offset_y: int = 0,
     initial_offset: int = 15,
+    real_input: bool = False,
 ) -> bool:
     """
     Perform a drag-and-drop operation compatible with @dnd-kit.
 
     @dnd-kit's PointerSensor requires >8px initial movement to activate drag.
-    This function uses ActionChains chaining with .pause() for reliable event processing.
     Uses incremental "wiggle" motion to ensure multiple pointermove events fire,
-    which helps headless Chrome reliably exceed the activation threshold.
-
-    Per DASH_TESTING_GUIDELINES.md:
-    - Use ActionChains chaining (not time.sleep)
-    - Use .pause() between actions for dnd-kit event processing
+    which helps headless Chrome reliably exceed the activation threshold. The
+    actions are split at the drag start and the drop, and each phase waits for
+    dnd-kit's drag state instead of a fixed pause. Unless ``real_input`` or
+    ``STRICT_USER_GESTURES`` is set, the drag is dispatched in-page by
+    :func:`_js_drag`, and the ActionChains path only runs if that script could
+    not dispatch any pointer event.
 
     Parameters
     ----------
@@ -545,12 +1188,21 @@ def perform_drag_and_drop(
     initial_offset : int
         Initial movement to trigger drag (must be >8px, default 15).
         Note: Now uses incremental 5px moves regardless of this value.
+    real_input : bool
+        Always drive the gesture through ActionChains (default False).
 
     Returns
     -------
     bool
-        True if drag completed without error.
+        True if drag completed without error, False if the in-page drag never
+        activated and was cancelled.
     """
+    if not (real_input or STRICT_USER_GESTURES):
+        status = _js_drag(dash_duo, source_element, target_element, offset_x, offset_y)
+        if status != "not-dispatched":
+            _wait_for_drag_state(dash_duo, active=False)
+            return status == "dropped"
+
     # Scroll source element into view to prevent MoveTargetOutOfBoundsException
     dash_duo.driver.execute_script(
         "arguments[0].scrollIntoView({block: 'center'});", source_element
@@ -559,19 +1211,19 @@ def perform_drag_and_drop(
     actions = ActionChains(dash_duo.driver)
 
     # Grab the element
-    actions.click_and_hold(source_element).pause(0.2)
+    actions.click_and_hold(source_element)
 
     # Incremental "wiggle" movement to reliably exceed 8px activation threshold
     # Multiple small moves generate multiple mousemove/pointermove events
-    actions.move_by_offset(5, 0).pause(0.1)
-    actions.move_by_offset(5, 0).pause(0.1)
-    actions.move_by_offset(5, 0).pause(0.1)
+    actions.move_by_offset(5, 0).move_by_offset(5, 0).move_by_offset(5, 0).perform()
+    _wait_for_drag_state(dash_duo, active=True)
 
-    # Move to target with optional offset
-    actions.move_to_element_with_offset(target_element, offset_x, offset_y).pause(0.3)
+    # Move to target with optional offset; one frame lets dnd-kit commit `over`
+    actions.move_to_element_with_offset(target_element, offset_x, offset_y).pause(0.05)
 
     # Release
     actions.release().perform()
+    _wait_for_drag_state(dash_duo, active=False)
     return True
 
 
@@ -580,6 +1232,7 @@ def drag_tab_to_position(
     source_tab_index: int,
     target_tab_index: int,
     panel_index: int = 0,
+    real_input: bool = False,
 ) -> bool:
     """
     Drag a tab to a new position within the same panel (reorder).
@@ -589,6 +1242,10 @@ def drag_tab_to_position(
     2. Move to the target tab element (sortable handles reordering on hover)
     3. Release
 
+    Like :func:`perform_drag_and_drop`, this uses the in-page :func:`_js_drag`
+    unless ``real_input`` or ``STRICT_USER_GESTURES`` is set, and only falls
+    back to ActionChains if that script dispatched nothing.
+
     Parameters
     ----------
     dash_duo : DashComposite
@@ -599,51 +1256,55 @@ def drag_tab_to_position(
         Index position to drop at.
     panel_index : int
         Panel index if multiple panels exist (default 0).
+    real_input : bool
+        Always drive the gesture through ActionChains (default False).
 
     Returns
     -------
     bool
-        True if operation completed.
+        True if operation completed, False if the tabs were not found or the
+        in-page drag never activated and was cancelled.
     """
     # Wait for layout to stabilize before attempting drag
     wait_for_panel_layout_stable(dash_duo, timeout=5.0)
     dash_duo.wait_for_element(PANEL_SELECTOR, timeout=5)
 
-    panels = get_panels(dash_duo)
-    if panel_index >= len(panels):
+    targets = _resolve_drag_targets(
+        dash_duo.driver, panel_index, source_tab_index, panel_index, target_tab_index
+    )
+    if targets is None or targets["targetTab"] is None:
         return False
 
-    panel = panels[panel_index]
-    tabs = panel.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-
-    if source_tab_index >= len(tabs) or target_tab_index >= len(tabs):
-        return False
+    source_tab = targets["sourceTab"]
+    target_tab = targets["targetTab"]
 
-    source_tab = tabs[source_tab_index]
-    target_tab = tabs[target_tab_index]
+    if not (real_input or STRICT_USER_GESTURES):
+        status = _js_drag(dash_duo, source_tab, target_tab)
+        if status != "not-dispatched":
+            _wait_for_drag_state(dash_duo, active=False)
+            return status == "dropped"
 
     # Scroll tab bar into view to prevent MoveTargetOutOfBoundsException
     # Scroll the source tab into view first
     dash_duo.driver.execute_script(
-        "arguments[0].scrollIntoView({block: 'center', inline: 'center'});", source_tab
-    )
-    dash_duo.driver.execute_script(
-        "arguments[0].scrollIntoView({block: 'center', inline: 'center'});", target_tab
+        "arguments[0].scrollIntoView({block: 'center', inline: 'center'});"
+        "arguments[1].scrollIntoView({block: 'center', inline: 'center'});",
+        source_tab,
+        target_tab,
     )
 
     # Use ActionChains with a stable sequence to avoid headless Chrome crashes
     actions = ActionChains(dash_duo.driver)
-    actions.move_to_element(source_tab).pause(0.1)
-    actions.click_and_hold().pause(0.2)
+    actions.move_to_element(source_tab).click_and_hold()
 
     # Incremental "wiggle" movement to reliably exceed 8px activation threshold
-    actions.move_by_offset(5, 0).pause(0.1)
-    actions.move_by_offset(5, 0).pause(0.1)
-    actions.move_by_offset(5, 0).pause(0.1)
+    actions.move_by_offset(5, 0).move_by_offset(5, 0).move_by_offset(5, 0).perform()
+    _wait_for_drag_state(dash_duo, active=True)
 
     # Move to target tab center and release
-    actions.move_to_element(target_tab).pause(0.2)
+    actions.move_to_element(target_tab).pause(0.05)
     actions.release().perform()
+    _wait_for_drag_state(dash_duo, active=False)
 
     return True
 
@@ -663,6 +1324,9 @@ def drag_tab_to_panel_edge(
     2. Start drag to make drop zones appear
     3. Move to the target drop zone and release
 
+    Unlike the reorder helpers this always uses real WebDriver input, so the
+    split tests keep covering the browser's own pointer events.
+
     Parameters
     ----------
     dash_duo : DashComposite
@@ -687,47 +1351,44 @@ def drag_tab_to_panel_edge(
     # Extra wait for React to settle under parallel execution
     dash_duo.wait_for_element(PANEL_SELECTOR, timeout=5)
 
-    panels = get_panels(dash_duo)
-    if source_panel_index >= len(panels) or target_panel_index >= len(panels):
-        return False
-
-    source_panel = panels[source_panel_index]
-
-    tabs = source_panel.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-    if tab_index >= len(tabs):
+    targets = _resolve_drag_targets(
+        dash_duo.driver, source_panel_index, tab_index, target_panel_index
+    )
+    if targets is None:
         return False
 
-    source_tab = tabs[tab_index]
+    source_tab = targets["sourceTab"]
 
     # Get source position for offset calculation
-    source_rect = source_tab.rect
+    source_rect = targets["sourceRect"]
     source_x = source_rect["x"] + source_rect["width"] / 2
     source_y = source_rect["y"] + source_rect["height"] / 2
 
     # Phase 1: Start drag to make drop zones appear
-    # Use longer pauses for stability under parallel execution
     actions = ActionChains(dash_duo.driver)
-    actions.click_and_hold(source_tab).pause(1.0).move_by_offset(15, 15).pause(1.0).perform()
+    actions.click_and_hold(source_tab).move_by_offset(15, 15).perform()
+    _wait_for_drag_state(dash_duo, active=True)
 
     # Wait for drop zones to appear (they only exist during active drag)
-    drop_zone_selector = f"[data-testid^='prism-drop-zone-{edge}']"
+    # and read its rect in the same script that finds it. Every panel renders drop
+    # zones during a drag, so match the target panel's zone exactly.
+    drop_zone_selector = f"[data-testid='prism-drop-zone-{edge}-{targets['targetPanelId']}']"
     try:
-        WebDriverWait(dash_duo.driver, 5.0).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, drop_zone_selector))
+        dz, dz_rect = WebDriverWait(dash_duo.driver, 2.0, poll_frequency=0.05).until(
+            lambda d: d.execute_script(
+                """
+                const el = document.querySelector(arguments[0]);
+                if (!el) return null;
+                const r = el.getBoundingClientRect();
+                return [el, {x: r.x, y: r.y, width: r.width, height: r.height}];
+                """,
+                drop_zone_selector,
+            )
         )
-    except Exception:
-        ActionChains(dash_duo.driver).release().perform()
-        return False
-
-    drop_zones = dash_duo.driver.find_elements(By.CSS_SELECTOR, drop_zone_selector)
-
-    if not drop_zones:
-        ActionChains(dash_duo.driver).release().perform()
+    except TimeoutException:
+        actions.release().perform()
         return False
 
-    dz = drop_zones[0]
-    dz_rect = dz.rect
-
     # Phase 2: Move to drop zone center and release
     dz_center_x = dz_rect["x"] + dz_rect["width"] / 2
     dz_center_y = dz_rect["y"] + dz_rect["height"] / 2
@@ -740,9 +1401,18 @@ def drag_tab_to_panel_edge(
     delta_x = int(dz_center_x - current_x)
     delta_y = int(dz_center_y - current_y)
 
-    # Move to drop zone and release with longer pause
-    actions2 = ActionChains(dash_duo.driver)
-    actions2.move_by_offset(delta_x, delta_y).pause(1.0).release().pause(1.0).perform()
+    # Move to drop zone; it renders a highlight child once dnd-kit reports it as `over`.
+    # The phase 1 builder is reused: perform() clears its queued actions, and
+    # the pointer keeps its pressed state between performs.
+    actions.move_by_offset(delta_x, delta_y).perform()
+    try:
+        WebDriverWait(dash_duo.driver, 2.0, poll_frequency=0.05).until(
+            lambda d: d.execute_script("return arguments[0].childElementCount > 0", dz)
+        )
+    except TimeoutException:
+        pass
+    actions.release().perform()
+    _wait_for_drag_state(dash_duo, active=False)
 
     # Wait for React to process the drop action and re-render
     # This explicit wait is critical for parallel test execution
@@ -781,35 +1451,30 @@ def drag_tab_to_other_panel(
     bool
         True if operation completed.
     """
-    panels = get_panels(dash_duo)
-    if source_panel_index >= len(panels) or target_panel_index >= len(panels):
-        return False
-
-    source_panel = panels[source_panel_index]
-    target_panel = panels[target_panel_index]
-
-    source_tabs = source_panel.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
-    if tab_index >= len(source_tabs):
+    # Resolve the source tab and the first tab in the target panel to drop onto
+    targets = _resolve_drag_targets(
+        dash_duo.driver, source_panel_index, tab_index, target_panel_index, 0
+    )
+    if targets is None:
         return False
 
-    source_tab = source_tabs[tab_index]
-
-    # Find a tab in the target panel to drop onto
-    target_tabs = target_panel.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
+    source_tab = targets["sourceTab"]
+    target_tab = targets["targetTab"]
 
     # Use ActionChains for the drag operation
     actions = ActionChains(dash_duo.driver)
-    actions.click_and_hold(source_tab).pause(0.5).move_by_offset(15, 15).pause(1.0)
+    actions.click_and_hold(source_tab).move_by_offset(15, 15).perform()
+    _wait_for_drag_state(dash_duo, active=True)
 
-    if target_tabs:
+    if target_tab is not None:
         # Drop onto the first tab in target panel
-        actions.move_to_element(target_tabs[0]).pause(1.0).release().pause(1.0).perform()
+        actions.move_to_element(target_tab).pause(0.05).release().perform()
     else:
         # No tabs in target panel - drop on the panel itself (upper area)
-        target_panel_rect = target_panel.rect
         actions.move_to_element_with_offset(
-            target_panel, 0, -target_panel_rect["height"] // 3
-        ).pause(1.0).release().pause(1.0).perform()
+            targets["targetPanel"], 0, -int(targets["targetPanelRect"]["height"]) // 3
+        ).pause(0.05).release().perform()
+    _wait_for_drag_state(dash_duo, active=False)
 
     return True
 
@@ -818,8 +1483,8 @@ def start_drag_without_drop(dash_duo, tab_index: int, panel_index: int = 0) -> N
     """
     Start a drag operation without releasing (for testing drag state).
 
-    Uses ActionChains chaining with .pause() per DASH_TESTING_GUIDELINES.md.
-    After calling this, use cancel_drag_with_escape() to cancel.
+    Returns once dnd-kit reports the drag as active (or after 2s if it never
+    activates). After calling this, use cancel_drag_with_escape() to cancel.
 
     Parameters
     ----------
@@ -830,30 +1495,23 @@ def start_drag_without_drop(dash_duo, tab_index: int, panel_index: int = 0) -> N
     panel_index : int
         Panel index (default 0).
     """
-    panels = get_panels(dash_duo)
-    if panel_index >= len(panels):
-        raise ValueError(f"Panel index {panel_index} out of range")
-
-    panel = panels[panel_index]
-    tabs = panel.find_elements(By.CSS_SELECTOR, TAB_SELECTOR)
+    targets = _resolve_drag_targets(dash_duo.driver, panel_index, tab_index, panel_index)
+    if targets is None:
+        raise ValueError(f"Tab index {tab_index} in panel {panel_index} out of range")
 
-    if tab_index >= len(tabs):
-        raise ValueError(f"Tab index {tab_index} out of range")
+    source_tab = targets["sourceTab"]
 
-    source_tab = tabs[tab_index]
-
-    # Use chained ActionChains with pause() - not time.sleep()
+    # >8px to trigger PointerSensor
     actions = ActionChains(dash_duo.driver)
-    actions.click_and_hold(source_tab).pause(1.0).move_by_offset(15, 15).pause(
-        1.0
-    ).perform()  # >8px to trigger PointerSensor
+    actions.click_and_hold(source_tab).move_by_offset(15, 15).perform()
+    _wait_for_drag_state(dash_duo, active=True)
 
 
 def cancel_drag_with_escape(dash_duo) -> None:
     """
     Cancel an active drag operation by pressing Escape.
 
-    Uses ActionChains chaining with .pause() per DASH_TESTING_GUIDELINES.md.
+    Returns once dnd-kit has ended the drag.
 
     Parameters
     ----------
@@ -861,7 +1519,8 @@ def cancel_drag_with_escape(dash_duo) -> None:
         The dash testing fixture.
     """
     actions = ActionChains(dash_duo.driver)
-    actions.send_keys(Keys.ESCAPE).pause(1.0).perform()
+    actions.send_keys(Keys.ESCAPE).perform()
+    _wait_for_drag_state(dash_duo, active=False)
 
 
 # =============================================================================
@@ -881,6 +1540,10 @@ def open_context_menu(dash_duo, tab_element):
     """
     Open context menu on a tab element.
 
+    Dispatches one synthetic ``contextmenu`` event at the tab's top-left
+    corner (Radix positions the menu from clientX/clientY). With
+    ``STRICT_USER_GESTURES`` a real ActionChains right-click is used.
+
     Parameters
     ----------
     dash_duo : DashComposite
@@ -888,7 +1551,125 @@ def open_context_menu(dash_duo, tab_element):
     tab_element : WebElement
         The tab element to right-click.
     """
-    ActionChains(dash_duo.driver).context_click(tab_element).perform()
+    if STRICT_USER_GESTURES:
+        ActionChains(dash_duo.driver).context_click(tab_element).perform()
+    else:
+        dash_duo.driver.execute_script(
+            """
+            const el = arguments[0];
+            const rect = el.getBoundingClientRect();
+            el.dispatchEvent(new MouseEvent('contextmenu', {
+                bubbles: true, cancelable: true, view: window, button: 2,
+                clientX: rect.x + 5, clientY: rect.y + 5
+            }));
+            """,
+            tab_element,
+        )
     WebDriverWait(dash_duo.driver, 3).until(
         EC.visibility_of_element_located((By.CSS_SELECTOR, CONTEXT_MENU))
     )
+
+
+def double_click(dash_duo, element) -> None:
+    """
+    Double-click an element with one synthetic ``dblclick`` event.
+
+    ActionChains sends move, two down/up pairs and perform as separate
+    commands; React's ``onDoubleClick`` only needs the ``dblclick`` event.
+    With ``STRICT_USER_GESTURES`` the real ActionChains gesture is used.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    element : WebElement
+        The element to double-click.
+    """
+    if STRICT_USER_GESTURES:
+        ActionChains(dash_duo.driver).double_click(element).perform()
+        return
+    dash_duo.driver.execute_script(
+        "arguments[0].dispatchEvent("
+        "new MouseEvent('dblclick', {bubbles: true, cancelable: true, view: window, detail: 2}));",
+        element,
+    )
+
+
+def wait_and_click(dash_duo, selector: str, timeout: float = 5.0):
+    """
+    Wait for an element to become clickable, then click it.
+
+    Fuses the usual ``wait_for_element`` + ``find_element`` + ``click`` triple
+    into one wait that hands back the element it matched, so the element
+    cannot be swapped out between the wait and the lookup.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    selector : str
+        CSS selector of the element to click.
+    timeout : float
+        Maximum wait time in seconds (default 5s).
+
+    Returns
+    -------
+    WebElement
+        The clicked element.
+    """
+    element = WebDriverWait(dash_duo.driver, timeout, poll_frequency=0.05).until(
+        EC.element_to_be_clickable((By.CSS_SELECTOR, selector)),
+        message=f"Element {selector} did not become clickable",
+    )
+    element.click()
+    return element
+
+
+# CDP Input.dispatchKeyEvent modifier bit flags, keyed by Selenium modifier key
+_CDP_MODIFIER_FLAGS = {Keys.ALT: 1, Keys.CONTROL: 2, Keys.COMMAND: 4, Keys.SHIFT: 8}
+
+
+def press_key_cdp(dash_duo, key: str, code: str, key_code: int, modifiers: tuple = ()) -> None:
+    """
+    Press and release a key via Chrome DevTools Protocol.
+
+    Sends one keyDown and one keyUp ``Input.dispatchKeyEvent`` instead of an
+    ActionChains sequence, skipping the pointer move/pause actions and the
+    per-modifier key_down/key_up steps.
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    key : str
+        DOM ``KeyboardEvent.key`` value (e.g. ``"Escape"``, ``"r"``).
+    code : str
+        DOM ``KeyboardEvent.code`` value (e.g. ``"Escape"``, ``"KeyR"``).
+    key_code : int
+        Windows virtual key code (e.g. 27 for Escape, 82 for R).
+    modifiers : tuple
+        Selenium modifier keys held during the press (e.g. ``(Keys.SHIFT,)``).
+    """
+    flags = 0
+    for modifier in modifiers:
+        flags |= _CDP_MODIFIER_FLAGS[modifier]
+    event = {
+        "key": key,
+        "code": code,
+        "windowsVirtualKeyCode": key_code,
+        "modifiers": flags,
+    }
+    dash_duo.driver.execute_cdp_cmd("Input.dispatchKeyEvent", {"type": "keyDown", **event})
+    dash_duo.driver.execute_cdp_cmd("Input.dispatchKeyEvent", {"type": "keyUp", **event})
+
+
+def press_escape(dash_duo) -> None:
+    """
+    Press Escape via CDP (closes menus, dropdowns and rename inputs).
+
+    Parameters
+    ----------
+    dash_duo : DashComposite
+        The dash testing fixture.
+    """
+    press_key_cdp(dash_duo, "Escape", "Escape", 27)
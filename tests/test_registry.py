@@ -93,6 +93,31 @@ def test_get_layout_metadata() -> None:
     assert "test" in metadata["metadata-test"]["keywords"]
 
 
+def test_layout_metadata_refreshes_after_registration(sample_layout) -> None:
+    """Test that metadata picks up layouts registered after a previous call."""
+    dash_prism.register_layout(id="first", name="First", layout=sample_layout)
+    assert list(dash_prism.get_registered_layouts_metadata()) == ["first"]
+
+    dash_prism.register_layout(id="second", name="Second", layout=sample_layout)
+    assert list(dash_prism.get_registered_layouts_metadata()) == ["first", "second"]
+
+    dash_prism.registry.unregister("first")
+    assert list(dash_prism.get_registered_layouts_metadata()) == ["second"]
+
+
+def test_layout_metadata_mutation_does_not_leak(sample_layout) -> None:
+    """Test that mutating returned metadata does not affect later calls."""
+    dash_prism.register_layout(id="immutable", name="Immutable", layout=sample_layout)
+
+    metadata = dash_prism.get_registered_layouts_metadata()
+    metadata["immutable"]["name"] = "Changed"
+    metadata["injected"] = {}
+
+    fresh = dash_prism.get_registered_layouts_metadata()
+    assert list(fresh) == ["immutable"]
+    assert fresh["immutable"]["name"] == "Immutable"
+
+
 def test_clear_registry(sample_layout) -> None:
     """Test clearing the registry."""
     dash_prism.register_layout(id="to-clear", name="Clear Me", layout=sample_layout)
@@ -126,6 +126,56 @@ def test_find_component_by_id() -> None:
     assert not_found is None
 
 
+def test_find_component_by_id_in_dict_and_tuple_children() -> None:
+    """Test finding a component nested in dict and tuple children."""
+    target = html.Span("Deep", id="deep")
+    layout = html.Div(children=({"slot": html.Div(children=(html.P("x"), target))},))
+
+    assert dash_prism.find_component_by_id(layout, "deep") is target
+
+
+def test_find_component_by_id_duplicate_ids() -> None:
+    """Test that the last match in depth-first pre-order wins when IDs are duplicated."""
+    deep = html.P("Deep", id="dup")
+    shallow = html.P("Shallow", id="dup")
+    sibling = html.P("Sibling", id="dup")
+
+    layout = html.Div([html.Div([deep]), shallow, sibling])
+    assert dash_prism.find_component_by_id(layout, "dup") is sibling
+
+    layout = html.Div([shallow, html.Div([deep])])
+    assert dash_prism.find_component_by_id(layout, "dup") is deep
+
+
+def test_find_component_by_id_stops_at_first_match() -> None:
+    """Test that nodes before the last match in pre-order are never inspected."""
+
+    class Explodes:
+        @property
+        def id(self):
+            raise AssertionError("visited a node before the match")
+
+        @property
+        def children(self):
+            raise AssertionError("visited a node before the match")
+
+    target = html.P("Target", id="target")
+    layout = html.Div([Explodes(), html.Div([Explodes()]), target])
+
+    assert dash_prism.find_component_by_id(layout, "target") is target
+
+
+def test_find_component_by_id_skips_primitive_leaves() -> None:
+    """Test that str/int/float/bool/None children are skipped."""
+    target = html.Span(id="after-leaves")
+    layout = html.Div(["text", 42, 3.5, True, None, html.Div([None, "more", target])])
+
+    assert dash_prism.find_component_by_id(layout, "after-leaves") is target
+    assert dash_prism.find_component_by_id(layout, "missing") is None
+    assert dash_prism.find_component_by_id("just a string", "missing") is None
+    assert dash_prism.find_component_by_id(None, "missing") is None
+
+
 def test_update_component_props() -> None:
     """Test updating component props."""
     layout = html.Div(